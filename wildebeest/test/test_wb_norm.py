@@ -5,7 +5,11 @@ Written by Ulf Hermjakob, USC/ISI
 Pytest for normalize.py
 """
 
+import io
+import itertools
 import logging as log
+import threading
+import time
 import wildebeest.wb_normalize as wb_norm
 
 log.basicConfig(level=log.INFO)
@@ -28,3 +32,89 @@ def test_indic_numbers():
     norm_s = wb.map_digits_to_ascii(s)
     ref_norm_s = '₹90 ₹90'
     assert norm_s == ref_norm_s
+
+
+def test_norm_clean_lines():
+    input_file = io.StringIO(''.join(f'line {i}  \n' for i in range(2500)))
+    output_file = io.StringIO()
+    wb.norm_clean_lines({}, input_file, output_file, output_batch_size=1000)
+    assert output_file.getvalue() == ''.join(f'line {i}\n' for i in range(2500))
+
+
+def test_norm_clean_lines_jobs():
+    text = ''.join(f'line {i}\u00A0\u0627\u0651\u064E  \n' for i in range(300))
+    ht1, ht2 = wb.build_norm_step_dict(base='ALL'), wb.build_norm_step_dict(base='ALL')
+    output_file1, output_file2 = io.StringIO(), io.StringIO()
+    wb.norm_clean_lines(ht1, io.StringIO(text), output_file1, output_batch_size=50)
+    wb.norm_clean_lines(ht2, io.StringIO(text), output_file2, output_batch_size=50, jobs=2)
+    assert output_file2.getvalue() == output_file1.getvalue()
+    assert ht2 == ht1
+
+
+def test_norm_clean_lines_repeated_lines():
+    wb.load_look_alike_file()
+    lines = ['\u0627\u0651\u064E x\u00A0y', 'plain', 'Austіn', '\uFB01ne  '] * 30
+    ht1, ht2 = wb.build_norm_step_dict(base='ALL'), wb.build_norm_step_dict(base='ALL')
+    output_file = io.StringIO()
+    wb.norm_clean_lines(ht1, io.StringIO(''.join(line + '\n' for line in lines)), output_file, output_batch_size=7)
+    expected_output = ''.join(wb.norm_clean_string(line.rstrip(' '), ht2, loc_id=line_number) + '\n'
+                              for line_number, line in enumerate(lines, 1))
+    assert output_file.getvalue() == expected_output
+    assert ht1 == ht2
+    # Steps skipped in ht are skipped for repeated lines too, also without skip_steps.
+    ht = {'SKIP-punct': True}
+    assert wb.norm_clean_line_batch(['a … b'] * 3, ht, line_cache={}) == 'a … b\n' * 3
+    assert ht['SKIP-punct'] is True
+
+
+def test_read_lines_in_chunks():
+    input_file = io.StringIO('abc\ndefgh\n\nij\x0ckl\nmn')
+    lines = list(wb_norm.read_lines_in_chunks(input_file, chunk_size=4))
+    assert lines == ['abc', 'defgh', '', 'ij\x0ckl', 'mn']
+
+
+def test_prefetch():
+    assert list(wb_norm.prefetch(iter(range(10)), maxsize=2)) == list(range(10))
+
+    def failing_items():
+        yield 1
+        raise ValueError('read error')
+    items = wb_norm.prefetch(failing_items())
+    assert next(items) == 1
+    try:
+        next(items)
+        assert False
+    except ValueError as e:
+        assert str(e) == 'read error'
+    # A consumer that stops early also stops the background thread.
+    n_threads = threading.active_count()
+    items = wb_norm.prefetch(itertools.count(), maxsize=2)
+    assert next(items) == 0
+    items.close()
+    for _ in range(50):
+        if threading.active_count() <= n_threads:
+            break
+        time.sleep(0.1)
+    assert threading.active_count() <= n_threads
+
+
+def test_look_alikes():
+    wb.load_look_alike_file()
+    ht = wb.build_norm_step_dict(base='NONE', add=['look-alike'])
+    assert wb.norm_clean_string('aйды жəне Austіn', ht) == 'айды және Austin'
+    assert wb.norm_clean_string('Austin', ht) == 'Austin'
+
+
+def test_skip_steps():
+    ht = wb.build_norm_step_dict(base='ALL', skip=['digit'])
+    assert 'digit' in wb.skip_steps_in_ht(ht)
+    assert 'punct' not in wb.skip_steps_in_ht(ht)
+    output_file = io.StringIO()
+    wb.norm_clean_lines(ht, io.StringIO('९० …\n'), output_file)
+    assert output_file.getvalue() == '९० ...\n'
+
+
+def test_repair_arabic_tokenization():
+    assert wb.repair_arabic_tokenization('ب12-ت %x') == 'ب 12- ت %x'
+    s = '1' * 100000 + 'x'
+    assert wb.repair_arabic_tokenization(s) == s
@@ -71,20 +71,272 @@ When using STDIN and/or STDOUT, if might be necessary, particularly for older ve
 """
 # -*- encoding: utf-8 -*-
 import argparse
-from itertools import chain
+from collections import defaultdict
+from itertools import chain, islice
 import datetime
+import heapq
 import logging as log
+import multiprocessing
+from operator import itemgetter
 import os
 from pathlib import Path
+import queue
 import re
 import sys
-from typing import Callable, List, Match, Optional, TextIO
+import threading
+from typing import Callable, Iterable, Iterator, List, Match, Optional, TextIO, Tuple, Union
 from wildebeest import __version__, last_mod_date
 
 
 log.basicConfig(level=log.INFO)
 data_dir = Path(__file__).parent / 'data'
 data_dir_path = str(data_dir.resolve())
+# Georgian Mtavruli and Asomtavruli/Nuskhuri letters mapped to Mkhedruli; built once per process.
+georgian_intab = "\u1C90\u1C91\u1C92\u1C93\u1C94\u1C95\u1C96\u1C97\u1C98\u1C99\u1C9A\u1C9B\u1C9C\u1C9D\u1C9E\u1C9F\u1CA0\u1CA1\u1CA2\u1CA3\u1CA4\u1CA5\u1CA6\u1CA7\u1CA8\u1CA9\u1CAA\u1CAB\u1CAC\u1CAD\u1CAE\u1CAF\u1CB0\u1CB1\u1CB2\u1CB3\u1CB4\u1CB5\u1CB6\u1CB7\u1CB8\u1CB9\u1CBA\u1CBD\u1CBE\u1CBF\u10A0\u10A1\u10A2\u10A3\u10A4\u10A5\u10A6\u10A7\u10A8\u10A9\u10AA\u10AB\u10AC\u10AD\u10AE\u10AF\u10B0\u10B1\u10B2\u10B3\u10B4\u10B5\u10B6\u10B7\u10B8\u10B9\u10BA\u10BB\u10BC\u10BD\u10BE\u10BF\u10C0\u10C1\u10C2\u10C3\u10C4\u10C5\u10C7\u10CD\u2D00\u2D01\u2D02\u2D03\u2D04\u2D05\u2D06\u2D07\u2D08\u2D09\u2D0A\u2D0B\u2D0C\u2D0D\u2D0E\u2D0F\u2D10\u2D11\u2D12\u2D13\u2D14\u2D15\u2D16\u2D17\u2D18\u2D19\u2D1A\u2D1B\u2D1C\u2D1D\u2D1E\u2D1F\u2D20\u2D21\u2D22\u2D23\u2D24\u2D25\u2D27\u2D2D"
+georgian_outtab = "\u10D0\u10D1\u10D2\u10D3\u10D4\u10D5\u10D6\u10D7\u10D8\u10D9\u10DA\u10DB\u10DC\u10DD\u10DE\u10DF\u10E0\u10E1\u10E2\u10E3\u10E4\u10E5\u10E6\u10E7\u10E8\u10E9\u10EA\u10EB\u10EC\u10ED\u10EE\u10EF\u10F0\u10F1\u10F2\u10F3\u10F4\u10F5\u10F6\u10F7\u10F8\u10F9\u10FA\u10FD\u10FE\u10FF\u10D0\u10D1\u10D2\u10D3\u10D4\u10D5\u10D6\u10D7\u10D8\u10D9\u10DA\u10DB\u10DC\u10DD\u10DE\u10DF\u10E0\u10E1\u10E2\u10E3\u10E4\u10E5\u10E6\u10E7\u10E8\u10E9\u10EA\u10EB\u10EC\u10ED\u10EE\u10EF\u10F0\u10F1\u10F2\u10F3\u10F4\u10F5\u10F7\u10FD\u10D0\u10D1\u10D2\u10D3\u10D4\u10D5\u10D6\u10D7\u10D8\u10D9\u10DA\u10DB\u10DC\u10DD\u10DE\u10DF\u10E0\u10E1\u10E2\u10E3\u10E4\u10E5\u10E6\u10E7\u10E8\u10E9\u10EA\u10EB\u10EC\u10ED\u10EE\u10EF\u10F0\u10F1\u10F2\u10F3\u10F4\u10F5\u10F7\u10FD"
+georgian_trantab = str.maketrans(georgian_intab, georgian_outtab)
+# Deleted in a single pass by Wildebeest.delete_control_characters.
+deletable_control_character_re = re.compile(r'[\u0000-\u0008'  # control characters C0 code block (except tab \x09,
+                                            r'\u000B-\u000C'   # linefeed \x0A, CR \x0D)
+                                            r'\u000E-\u001F'
+                                            r'\u007F-\u009F]')  # control characters 'DELETE' and C1 code block
+# Precompiled regular expressions used by normalization steps such as Wildebeest.repair_encoding_errors.
+surrogate_re = re.compile(r'[\uDC80-\uDCFF]')
+misencoded_utf8_3_byte_re = re.compile(r'\u00E2[\u0080-\u00BF][\u0080-\u00BF]')
+misencoded_utf8_2_byte_re = re.compile(r'[\u00C2-\u00C3\u00C5\u00C6\u00CB][\u0080-\u02FF\u2000-\u21FF]')
+c1_control_character_re = re.compile(r'[\u0080-\u009F]')
+# Variation selectors 1-16 and 17-256 that follow most letters, numbers, punctuation, in a single pass.
+# A selector 17-256 right after such a deleted selector 1-16 is deleted as well (as by two consecutive passes).
+variation_selector_re = re.compile(r'(?<=[\u0000-\u218F])(?:[\uFE00-\uFE0F][\U000E0100-\U000E01EF]?'
+                                   r'|[\U000E0100-\U000E01EF])')
+arabic_pres_form_re = re.compile(r'[\uFB50-\uFDFF\uFE70-\uFEFC]')
+cjk_compatibility_re = re.compile(r'[\u2F00-\u2FDF\u3038-\u303A\u3250\u32C0-\u33FF\uF900-\uFAFF]')
+cjk_compatibility_supplement_re = re.compile(r'[\U0001F190\U0001F200\U0002F800-\U0002FA1F]')
+combining_modifier_re = re.compile(r'[\u0300-\u036F\u0653-\u0655\u3099\u309A]')
+char_with_3_combining_modifiers_re = re.compile(r'.[\u0300-\u036F\u0653-\u0655\u3099\u309A]{3}')
+char_with_2_combining_modifiers_re = re.compile(r'.[\u0300-\u036F\u0653-\u0655\u3099\u309A]{2}')
+char_with_1_combining_modifier_re = re.compile(r'.[\u0300-\u036F\u0653-\u0655\u3099\u309A]')
+south_asian_combining_sign_re = re.compile(r'[\u093C\u09BE-\u102E\u1B35\U00011000-\U000115FF]')
+char_with_south_asian_combining_sign_re = re.compile(r'.[\u093C\u09BE-\u102E\u1B35\U00011000-\U000115FF]')
+decomposable_indic_tibetan_hebrew_re = re.compile(r'[\u0344\u0958-\u095F\u09DC-\u0B5D\u0F43-\u0FB9\u2ADC\uFB1D-\uFB4E]')
+musical_symbol_re = re.compile(r'[\U0001D100-\U0001D1FF]')
+hangul_vowel_jamo_re = re.compile(r'[\u1161-\u1175]')
+hangul_jamo_sequence_re = re.compile(r'([\u1100-\u1112])([\u1161-\u1175])([\u11A8-\u11C2]|)')  # trailing jamo can be ''
+mappable_punctuation_re = re.compile(r'[\u2011\u2024-\u2026\u2033-\u203C\u2047-\u2057]')
+mappable_angle_bracket_re = re.compile(r'[\u2329-\u232A\u2A74-\u2A76]')
+mappable_math_symbol_re = re.compile(r'[\u222C-\u2230\u2A0C]')
+number_with_period_or_comma_re = re.compile(r'[\u2488-\u249B\U0001F100-\U0001F10A]')
+zero_width_character_re = re.compile(r'[\u200B-\u200F]')
+dash_re = re.compile(r'[\u2010-\u2015'  # hyphen, non-breaking hyphen, figure dash, en dash, em dash, horizontal bar
+                     r'\u2212'  # U+2212 minus sign
+                     r'\u2500\u2501'  # U+2500 box drawings light/heavy horizontal
+                     r'\u2E3A\u2E3B]')  # U+2E3A two-em dash, U+2E3B three-em dash
+non_zero_space_re = re.compile(r'[\u00A0'  # NO-BREAK SPACE
+                               r'\u2000-\u200A'  # EN QUAD ... HAIR SPACE
+                               r'\u202F'  # NARROW NO-BREAK SPACE
+                               r'\u205F'  # MEDIUM MATHEMATICAL SPACE
+                               r'\u3000]')  # IDEOGRAPHIC SPACE
+half_and_full_width_re = re.compile(r'[\uFF01-\uFFEE]')
+font_re = re.compile(r'[\u2102-\u2149\uFB20-\uFB29\U0001D400-\U0001D7FF\U0001EE00-\U0001EEBB\U0001FBF0-\U0001FBF9]')
+small_form_re = re.compile(r'[\uFE50-\uFE6F]')
+vertical_form_re = re.compile(r'[\u309F\u30FF\uFE10-\uFE19\uFE30-\uFE48]')
+enclosure_re = re.compile(r'[\u2460-\u2488\u249C-\u2500\u3036\u3200-\u3250\u3251-\u32C0\u32D0-\u32FF]')
+enclosure_supplement_re = re.compile(r'[\U0001F110-\U0001F16A\U0001F201-\U0001F260]')
+roman_numeral_re = re.compile(r'[\u2160-\u217F]')
+hangul_compatibility_re = re.compile(r'[\u3131-\u318E]')
+thai_lao_compatibility_re = re.compile(r'[\u0E33\u0EB3\u0EDC\u0EDD]')
+multi_level_xml_escape_re = re.compile(r'(?<=&)(?:amp;)+(?=(?:amp|apos|gt|lt|nbsp|quot|#\d{1,6}|#x[0-9A-F]{1,5});)',
+                                       flags=re.IGNORECASE)
+double_url_escape_2_byte_re = re.compile(r"(%)25([CD][0-9A-F]%)25([89AB][0-9A-F])")
+double_url_escape_3_byte_re = re.compile(r'(%)25(E[0-9A-F]%)25([89AB][0-9A-F]%)25([89AB][0-9A-F])')
+# Latin-script URL with a Cyrillic path (case-insensitive) or Cyrillic-script URL, see Wildebeest.is_mixed_script_url.
+mixed_script_url_re = re.compile(r'(?i:(?:https?://)?[a-zA-Z][-_./0-9a-zA-Z]*\.(?:bg|by|me|mk|kg|kz|rs|ru|tj|tm|ua|uz|'
+                                 r'com|info)/[-_./#0-9\u0400-\u04FF]+$)'
+                                 r'|(?:https?://)?[\u0400-\u04FF][-_./0-9\u0400-\u04FF]*'
+                                 r'\.(bg|by|me|mk|kg|kz|rs|ru|tj|tm|ua|uz|com|info)$')
+first_token_re = re.compile(r'(\s*)(\S+)(.*)$')
+whitespace_split_re = re.compile(r'(\s+)')
+roman_numeral_token_re = re.compile(r'(?:X|XX|XXX|XL|L|LX|LXX|LXXX|XC|)(?:I|II|III|IV|V|VI|VII|VIII|IX|)$')
+trailing_spaces_re = re.compile(' +(?=[\t\n])')
+# Non-ASCII decimal digits by script group, each group mapped in a single pass by Wildebeest.map_digits_to_ascii.
+arabic_digit_re = re.compile(r'[\u0660-\u0669'  # ARABIC-INDIC digits
+                              r'\u06F0-\u06F9]')  # EXTENDED ARABIC-INDIC digits
+thaana_plus_digit_re = re.compile(r'[\u07C0-\u07C9]')  # NKO digits
+devanagari_digit_re = re.compile(r'[\u0966-\u096F]')  # DEVANAGARI digits
+bengali_plus_digit_re = re.compile(r'[\u09E6-\u09EF'  # BENGALI digits
+                                    r'\u0A66-\u0A6F'  # GURMUKHI digits
+                                    r'\u0AE6-\u0AEF'  # GUJARATI digits
+                                    r'\u0B66-\u0B6F'  # ORIYA digits
+                                    r'\u0BE6-\u0BEF'  # TAMIL digits
+                                    r'\u0C66-\u0C6F'  # TELUGU digits
+                                    r'\u0CE6-\u0CEF'  # KANNADA digits
+                                    r'\u0D66-\u0D6F'  # MALAYALAM digits
+                                    r'\u0DE6-\u0DEF]')  # SINHALA LITH digits
+thai_plus_digit_re = re.compile(r'[\u0E50-\u0E59'  # THAI digits
+                                 r'\u0ED0-\u0ED9'  # LAO digits
+                                 r'\u0F20-\u0F29'  # TIBETAN digits
+                                 r'\u1040-\u1049'  # MYANMAR digits
+                                 r'\u1090-\u1099]')  # MYANMAR SHAN digits
+khmer_plus_digit_re = re.compile(r'[\u17E0-\u17E9'  # KHMER digits
+                                  r'\u1810-\u1819'  # MONGOLIAN digits
+                                  r'\u1946-\u194F'  # LIMBU digits
+                                  r'\u19D0-\u19DA'  # NEW TAI LUE digits
+                                  r'\u1A80-\u1A89'  # TAI THAM HORA digits
+                                  r'\u1A90-\u1A99'  # TAI THAM THAM digits
+                                  r'\u1B50-\u1B59'  # BALINESE digits
+                                  r'\u1BB0-\u1BB9'  # SUNDANESE digits
+                                  r'\u1C40-\u1C49'  # LEPCHA digits
+                                  r'\u1C50-\u1C59]')  # OL CHIKI digits
+lisu_plus_digit_re = re.compile(r'[\uA620-\uA629'  # VAI digits
+                                 r'\uA8D0-\uA8D9'  # SAURASHTRA digits
+                                 r'\uA900-\uA909'  # KAYAH LI digits
+                                 r'\uA9D0-\uA9D9'  # JAVANESE digits
+                                 r'\uA9F0-\uA9F9'  # MYANMAR TAI LAING digits
+                                 r'\uAA50-\uAA59'  # CHAM digits
+                                 r'\uABF0-\uABF9]')  # MEETEI MAYEK digits
+block_100_plus_digit_re = re.compile(r'[\U000104A0-\U000104A9'  # OSMANYA digits
+                                      r'\U00010D30-\U00010D39'  # HANIFI ROHINGYA digits
+                                      r'\U00011066-\U0001106F'  # BRAHMI digits
+                                      r'\U000110F0-\U000110F9'  # SORA SOMPENG digits
+                                      r'\U00011136-\U0001113F'  # CHAKMA digits
+                                      r'\U000111D0-\U000111D9'  # SHARADA digits
+                                      r'\U000112F0-\U000112F9'  # KHUDAWADI digits
+                                      r'\U00011450-\U00011459'  # NEWA digits
+                                      r'\U000114D0-\U000114D9'  # TIRHUTA digits
+                                      r'\U00011650-\U00011659'  # MODI digits
+                                      r'\U000116C0-\U000116C9'  # TAKRI digits
+                                      r'\U00011730-\U00011739'  # AHOM digits
+                                      r'\U000118E0-\U000118E9'  # WARANG CITI digits
+                                      r'\U00011C50-\U00011C59'  # BHAIKSUKI digits
+                                      r'\U00011D50-\U00011D59'  # MASARAM GONDI digits
+                                      r'\U00011DA0-\U00011DA9'  # GUNJALA GONDI digits
+                                      r'\U00016A60-\U00016A69'  # MRO digits
+                                      r'\U00016B50-\U00016B59'  # PAHAWH HMONG digits
+                                      r'\U0001E950-\U0001E959]')  # ADLAM digits
+# Repairs of the order of Indic vowel signs (incl. virama) and nuktas by script group,
+# as (nukta, regex, replacement) triples (see Wildebeest.repair_combining_modifiers_with_nukta).
+devanagari_nukta_repairs = [
+    ('\u093C', re.compile(r'([\u093E-\u094D])(\u093C+)'), r'\2\1'),  # Devanagari
+    ('\u093C', re.compile(r'(\u093C)\u093C+'), r'\1')]  # remove duplicate Devanagari nuktas
+# Bengali, Gurmukhi, Gujarati, Oriya, Tamil, Telugu, Kannada, Malayalam, Sinhala
+bengali_plus_nukta_repairs = [
+    ('\u09BC', re.compile(r'([\u09BE-\u09CD])(\u09BC+)'), r'\2\1'),  # Bengali
+    ('\u0A3C', re.compile(r'([\u0A3E-\u0A4D])(\u0A3C+)'), r'\2\1'),  # Gurmukhi
+    ('\u0ABC', re.compile(r'([\u0ABE-\u0ACD])(\u0ABC+)'), r'\2\1'),  # Gujarati
+    ('\u0B3C', re.compile(r'([\u0B3E-\u0B4D])(\u0B3C+)'), r'\2\1'),  # Oriya
+    ('\u0CBC', re.compile(r'([\u0CBE-\u0CCD])(\u0CBC+)'), r'\2\1'),  # Kannada
+    ('\u09BC', re.compile(r'(\u09BC)\u09BC+'), r'\1'),  # remove duplicate Bengali nuktas
+    ('\u0A3C', re.compile(r'(\u0A3C)\u0A3C+'), r'\1'),  # remove duplicate Gurmukhi nuktas
+    ('\u0ABC', re.compile(r'(\u0ABC)\u0ABC+'), r'\1'),  # remove duplicate Gujarati nuktas
+    ('\u0B3C', re.compile(r'(\u0B3C)\u0B3C+'), r'\1'),  # remove duplicate Oriya nuktas
+    ('\u0CBC', re.compile(r'(\u0CBC)\u0CBC+'), r'\1')]  # remove duplicate Kannada nuktas
+khmer_plus_nukta_repairs = [
+    ('\u1C37', re.compile(r'([\u1C26-\u1C2C])(\u1C37)'), r'\2\1')]  # Lepcha
+block_100_plus_nukta_repairs = [
+    ('\U000110BA', re.compile(r'([\U000110B0-\U000110B8])(\U000110BA)'), r'\2\1'),  # Kaithi
+    ('\U000111CA', re.compile(r'([\U000111B3-\U000111C0])(\U000111CA)'), r'\2\1'),  # Sharada
+    ('\U00011236', re.compile(r'([\U0001122C-\U00011235])(\U00011236)'), r'\2\1'),  # Khojki
+    ('\U000112E9', re.compile(r'([\U000112E0-\U000112E8\U000112EA])(\U000112E9)'), r'\2\1'),  # Khudawadi
+    ('\U0001133C', re.compile(r'([\U0001133E-\U0001134D])(\U0001133C)'), r'\2\1'),  # Grantha
+    ('\U00011446', re.compile(r'([\U00011435-\U00011442])(\U00011446)'), r'\2\1'),  # Newa
+    ('\U000114C3', re.compile(r'([\U000114B0-\U000114C2])(\U000114C3)'), r'\2\1'),  # Tirhuta
+    ('\U000115C0', re.compile(r'([\U000115AF-\U000115BF])(\U000115C0)'), r'\2\1'),  # Siddham
+    ('\U000116B7', re.compile(r'([\U000116AD-\U000116B6])(\U000116B7)'), r'\2\1'),  # Takri
+    ('\U0001183A', re.compile(r'([\U0001182C-\U00011839])(\U0001183A)'), r'\2\1'),  # Dogra
+    ('\U00011943', re.compile(r'([\U00011930-\U0001193E])(\U00011943)'), r'\2\1'),  # Dives Akuru
+    ('\U00011D42', re.compile(r'([\U00011D31-\U00011D3F\U00011D45])(\U00011D42)'), r'\2\1')]  # Masaram Gondi
+# Non-Arabic ligatures, mapped in a single pass by Wildebeest.normalize_ligatures.
+ligature_dict = {
+    '\u0132': '\u0049\u004A',         # U+0132 LATIN CAPITAL LIGATURE IJ Ĳ -> IJ
+    '\u0133': '\u0069\u006A',         # U+0133 LATIN SMALL LIGATURE IJ ĳ -> ij
+    '\u013F': '\u004C\u00B7',         # U+013F LATIN CAPITAL LETTER L WITH MIDDLE DOT Ŀ -> L·
+    '\u0140': '\u006C\u00B7',         # U+0140 LATIN SMALL LETTER L WITH MIDDLE DOT ŀ -> l·
+    '\u0149': '\u02BC\u006E',         # U+0149 LATIN SMALL LETTER N PRECEDED BY APOSTROPHE ŉ -> ʼn \
+    '\u017F': '\u0073',               # U+017F LATIN SMALL LETTER LONG S ſ -> s
+    '\u01C4': '\u0044\u017D',         # U+01C4 LATIN CAPITAL LETTER DZ WITH CARON Ǆ -> DŽ
+    '\u01C5': '\u0044\u017E',         # U+01C5 LATIN CAPITAL D WITH SMALL Z WITH CARON ǅ -> Dž
+    '\u01C6': '\u0064\u017E',         # U+01C6 LATIN SMALL LETTER DZ WITH CARON ǆ -> dž
+    '\u01C7': '\u004C\u004A',         # U+01C7 LATIN CAPITAL LETTER LJ Ǉ -> LJ
+    '\u01C8': '\u004C\u006A',         # U+01C8 LATIN CAPITAL LETTER L WITH SMALL LETTER J ǈ -> Lj
+    '\u01C9': '\u006C\u006A',         # U+01C9 LATIN SMALL LETTER LJ ǉ -> lj
+    '\u01CA': '\u004E\u004A',         # U+01CA LATIN CAPITAL LETTER NJ Ǌ -> NJ
+    '\u01CB': '\u004E\u006A',         # U+01CB LATIN CAPITAL LETTER N WITH SMALL LETTER J ǋ -> Nj
+    '\u01CC': '\u006E\u006A',         # U+01CC LATIN SMALL LETTER NJ ǌ -> nj
+    '\u01F1': '\u0044\u005A',         # U+01F1 LATIN CAPITAL LETTER DZ Ǳ -> DZ
+    '\u01F2': '\u0044\u007A',         # U+01F2 LATIN CAPITAL LETTER D WITH SMALL LETTER Z ǲ -> Dz
+    '\u01F3': '\u0064\u007A',         # U+01F3 LATIN SMALL LETTER DZ ǳ -> dz
+    '\u1E9B': '\u1E61',               # U+1E9B LATIN SMALL LETTER LONG S WITH DOT ABOV ẛ -> ṡ
+    '\uFB00': '\u0066\u0066',         # U+FB00 LATIN SMALL LIGATURE FF ﬀ -> ff
+    '\uFB01': '\u0066\u0069',         # U+FB01 LATIN SMALL LIGATURE FI ﬁ -> fi
+    '\uFB02': '\u0066\u006C',         # U+FB02 LATIN SMALL LIGATURE FL ﬂ -> fl
+    '\uFB03': '\u0066\u0066\u0069',   # U+FB03 LATIN SMALL LIGATURE FFI ﬃ -> ffi
+    '\uFB04': '\u0066\u0066\u006C',   # U+FB04 LATIN SMALL LIGATURE FFL ﬄ -> ffl
+    '\uFB05': '\u0073\u0074',         # U+FB05 LATIN SMALL LIGATURE LONG S T ﬅ -> ſt
+    '\uFB06': '\u0073\u0074',         # U+FB06 LATIN SMALL LIGATURE ST ﬆ -> st
+    '\uFB13': '\u0574\u0576',         # U+FB13 ARMENIAN SMALL LIGATURE MEN NOW ﬓ -> մն
+    '\uFB14': '\u0574\u0565',         # U+FB14 ARMENIAN SMALL LIGATURE MEN ECH ﬔ -> մե
+    '\uFB15': '\u0574\u056B',         # U+FB15 ARMENIAN SMALL LIGATURE MEN INI ﬕ -> մի
+    '\uFB16': '\u057E\u0576',         # U+FB16 ARMENIAN SMALL LIGATURE VEW NOW ﬖ -> վն
+    '\uFB17': '\u0574\u056D',         # U+FB17 ARMENIAN SMALL LIGATURE MEN XEH ﬗ -> մխ
+    '\uFB49': '\u05E9\u05BC',         # U+FB49 HEBREW LETTER SHIN WITH DAGESH שּ -> שּ
+    '\uFB4F': '\u05D0\u05DC'}         # U+FB4F HEBREW LIGATURE ALEF LAMED ﭏ -> אל
+ligature_re = re.compile('[' + ''.join(ligature_dict) + ']')
+# Signs and symbols, mapped in a single pass by Wildebeest.normalize_signs_and_symbols.
+sign_and_symbol_dict = {
+    '\u00B5': '\u03BC',    # U+00B5 MICRO SIGN µ -> μ (GREEK SMALL LETTER MU)
+    '\u03D0': '\u03B2',    # U+03D0 GREEK BETA SYMBOL ϐ -> β
+    '\u03D1': '\u03B8',    # U+03D1 GREEK THETA SYMBOL ϑ -> θ
+    '\u03D2': '\u03A5',    # U+03D2 GREEK UPSILON WITH HOOK SYMBOL ϒ -> Υ
+    '\u03D3': '\u038E',    # U+03D3 GREEK UPSILON WITH ACUTE AND HOOK SYMBOL ϓ -> Ύ
+    '\u03D4': '\u03AB',    # U+03D4 GREEK UPSILON WITH DIAERESIS AND HOOK SYMBOL ϔ -> Ϋ
+    '\u03D5': '\u03C6',    # U+03D5 GREEK PHI SYMBOL ϕ -> φ
+    '\u03D6': '\u03C0',    # U+03D6 GREEK PI SYMBOL ϖ -> π
+    '\u03F0': '\u03BA',    # U+03F0 GREEK KAPPA SYMBOL ϰ -> κ
+    '\u03F1': '\u03C1',    # U+03F1 GREEK RHO SYMBOL ϱ -> ρ
+    '\u03F2': '\u03C2',    # U+03F2 GREEK LUNATE SIGMA SYMBOL ϲ -> ς
+    '\u03F4': '\u0398',    # U+03F4 GREEK CAPITAL THETA SYMBOL ϴ -> Θ
+    '\u03F5': '\u03B5',    # U+03F5 GREEK LUNATE EPSILON SYMBOL ϵ -> ε
+    '\u03F9': '\u03A3',    # U+03F9 GREEK CAPITAL LUNATE SIGMA SYMBOL Ϲ -> Σ
+    '\u20A8': 'Rs',        # U+20A8 RUPEE SIGN ₨ -> Rs
+    '\u2103': '\u00B0C',   # U+2103 DEGREE CELIUS ℃ -> °C
+    '\u2107': '\u0190',    # U+2107 EULER CONSTANT ℇ -> Ɛ
+    '\u2109': '\u00B0F',   # U+2109 DEGREE FAHRENHEIT ℉ -> °F
+    '\u2116': 'No.',       # U+2116 NUMERO SIGN № -> No.
+    '\u2126': '\u03A9',    # U+2126 OHM SIGN Ω -> Ω (GREEK CAPITAL LETTER OMEGA)
+    '\u212A': '\u004B',    # U+212A KELVIN SIGN K -> K (LATIN CAPITAL LETTER K)
+    '\u212B': '\u00C5',    # U+212B ANGSTROM SIGN Å -> Å (LATIN CAP. LETTER A WITH RING ABOVE)
+    '\u2135': '\u05D0',    # U+2135 ALEF SYMBOL ℵ -> א
+    '\u2136': '\u05D1',    # U+2136 BET SYMBOL ℶ -> ב
+    '\u2137': '\u05D2',    # U+2137 GIMEL SYMBOL ℷ -> ג
+    '\u2138': '\u05D3',    # U+2138 DALET SYMBOL ℸ -> ד
+    '\u213B': 'FAX'}       # U+213B FACSIMILE SIGN ℻ -> FAX
+sign_and_symbol_re = re.compile('[' + ''.join(sign_and_symbol_dict) + ']')
+# Punctuation and math symbols, mapped in a single pass by Wildebeest.normalize_punctuation.
+punctuation_dict = {
+    # punctuation
+    '\u00AB': '\u201C',  # U+201E left double-angle quotation mark -> left double quotation mark
+    '\u00BB': '\u201D',  # U+201F right double-angle quotation mark -> right double quotation mark
+    '\u201A': '\u2018',  # U+201A single low-9 quotation mark -> left single quotation mark
+    '\u201B': '\u2018',  # U+201B single high-reversed-9 quotation mark -> left single quotation mark
+    '\u201E': '\u201C',  # U+201E double low-9 quotation mark -> left double quotation mark
+    '\u201F': '\u201C',  # U+201F double high-reversed-9 quotation mark -> left double quotation mark
+    '\u2039': '\u2018',  # U+2039 left single-angle quotation mark -> left single quotation mark
+    '\u203A': '\u2019',  # U+203A right single-angle quotation mark -> right single quotation mark
+    # math symbols
+    '\u2212': '-',       # U+2212 minus sign
+    '\u2215': '/',       # U+2215 division slash
+    '\u2216': '\\',      # U+2216 set minus
+    '\u2217': '*',       # U+2217 asterisk operator
+    '\u2218': '\u25E6',  # U+2218 ring operator -> white bullet
+    '\u2219': '\u2022',  # U+2219 bullet operator -> bullet
+    '\u2223': '|',       # U+2223 divides
+    '\u2236': ':',       # U+2236 ratio
+    '\u2254': ':=',      # U+2254 colon equals
+    '\u2255': '=:',      # U+2255 equals colon
+    '\u22C5': '\u00B7'}  # U+22C5 dot operator -> middle dot
+punctuation_re = re.compile('[' + ''.join(punctuation_dict) + ']')
+# char_type_vector_dict and mapping_dict as initially built by the first Wildebeest instance (see init_char_tables).
+char_tables_cache = {}
 
 
 class Wildebeest:
@@ -242,32 +494,54 @@ class Wildebeest:
         bit_vector = bit_vector << 1
         # Korean
         self.char_is_mappable_hangul = bit_vector
+        bit_vector = bit_vector << 1
         # self.char_is_armenian = bit
         # self.char_is_japanese_kana = bit
-        self.range_init_char_type_vector_dict()
+        # Line-level bit, not set by any individual character, but by norm_clean_string for lines with
+        # letters from at least two of the look-alike scripts (Latin, Greek, Cyrillic).
+        self.line_has_multiple_look_alike_scripts = bit_vector
+        self.look_alike_script_mask = self.char_is_latin | self.char_is_greek | self.char_is_cyrillic
+        self.nukta_script_mask = (self.char_is_devanagari | self.char_is_bengali_plus | self.char_is_khmer_plus
+                                  | self.char_is_100_plus_block_of_interest)
+        # Dispatch tables for norm_clean_string, built on demand, one per language-specific variant.
+        self.norm_step_dispatch_tables = {}
+        # Cache for applicable_norm_steps. A text typically has only a modest number of distinct line vectors (lv).
+        self.applicable_norm_steps_cache = {}
+        # ht keys by normalization/cleaning group (see ncs_group).
+        self.ncs_group_stat_keys = {}
         #
         # Initialize general mapping dictionary, which normalizes source strings (of length 1-3 characters)
         # to target strings (of length 0-5 characters).
         self.mapping_dict = {}
-        self.init_mapping_dict()
+        self.init_char_tables()
+        # Bound once and passed as the replacement function to the many mapping-dict re.sub calls.
+        self.mapping_dict_repl = self.apply_mapping_dict
+        # ASCII characters share only a handful of distinct character type vectors, which set_lv uses for ASCII lines.
+        self.ascii_char_type_groups = self.char_type_groups(map(chr, range(0x80)))
         self.look_alike_dict = {}
         self.look_alike_unchanged_dict = {}
         self.look_alike_split_dict = {}
         self.look_alike_url_dict = {}
+        # Results of analyze_look_alike_token by token.
+        self.look_alike_token_cache = {}
         self.look_alike_scripts = ['Latin', 'Greek', 'Cyrillic']
-        self.repair_tok_punct_arabic_match = re.compile(r"([-_+*|%0-9]+)([\u0600-\u06FF])")
-        self.repair_tok_arabic_punct_match = re.compile(r"([\u0600-\u06FF])([-_+*|%0-9]+)")
-        self.georgian_intab = "\u1C90\u1C91\u1C92\u1C93\u1C94\u1C95\u1C96\u1C97\u1C98\u1C99\u1C9A\u1C9B\u1C9C\u1C9D\u1C9E\u1C9F\u1CA0\u1CA1\u1CA2\u1CA3\u1CA4\u1CA5\u1CA6\u1CA7\u1CA8\u1CA9\u1CAA\u1CAB\u1CAC\u1CAD\u1CAE\u1CAF\u1CB0\u1CB1\u1CB2\u1CB3\u1CB4\u1CB5\u1CB6\u1CB7\u1CB8\u1CB9\u1CBA\u1CBD\u1CBE\u1CBF\u10A0\u10A1\u10A2\u10A3\u10A4\u10A5\u10A6\u10A7\u10A8\u10A9\u10AA\u10AB\u10AC\u10AD\u10AE\u10AF\u10B0\u10B1\u10B2\u10B3\u10B4\u10B5\u10B6\u10B7\u10B8\u10B9\u10BA\u10BB\u10BC\u10BD\u10BE\u10BF\u10C0\u10C1\u10C2\u10C3\u10C4\u10C5\u10C7\u10CD\u2D00\u2D01\u2D02\u2D03\u2D04\u2D05\u2D06\u2D07\u2D08\u2D09\u2D0A\u2D0B\u2D0C\u2D0D\u2D0E\u2D0F\u2D10\u2D11\u2D12\u2D13\u2D14\u2D15\u2D16\u2D17\u2D18\u2D19\u2D1A\u2D1B\u2D1C\u2D1D\u2D1E\u2D1F\u2D20\u2D21\u2D22\u2D23\u2D24\u2D25\u2D27\u2D2D"
-        self.georgian_outtab = "\u10D0\u10D1\u10D2\u10D3\u10D4\u10D5\u10D6\u10D7\u10D8\u10D9\u10DA\u10DB\u10DC\u10DD\u10DE\u10DF\u10E0\u10E1\u10E2\u10E3\u10E4\u10E5\u10E6\u10E7\u10E8\u10E9\u10EA\u10EB\u10EC\u10ED\u10EE\u10EF\u10F0\u10F1\u10F2\u10F3\u10F4\u10F5\u10F6\u10F7\u10F8\u10F9\u10FA\u10FD\u10FE\u10FF\u10D0\u10D1\u10D2\u10D3\u10D4\u10D5\u10D6\u10D7\u10D8\u10D9\u10DA\u10DB\u10DC\u10DD\u10DE\u10DF\u10E0\u10E1\u10E2\u10E3\u10E4\u10E5\u10E6\u10E7\u10E8\u10E9\u10EA\u10EB\u10EC\u10ED\u10EE\u10EF\u10F0\u10F1\u10F2\u10F3\u10F4\u10F5\u10F7\u10FD\u10D0\u10D1\u10D2\u10D3\u10D4\u10D5\u10D6\u10D7\u10D8\u10D9\u10DA\u10DB\u10DC\u10DD\u10DE\u10DF\u10E0\u10E1\u10E2\u10E3\u10E4\u10E5\u10E6\u10E7\u10E8\u10E9\u10EA\u10EB\u10EC\u10ED\u10EE\u10EF\u10F0\u10F1\u10F2\u10F3\u10F4\u10F5\u10F7\u10FD"
-        self.georgian_trantab = str.maketrans(self.georgian_intab, self.georgian_outtab)
+        # Same character mappings as in look_alike_dict, but by (source script, target script), so that lookups
+        # don't need to build a string key per character.
+        self.look_alike_script_pair_dict = {(script1, script2): {} for script1 in self.look_alike_scripts
+                                            for script2 in self.look_alike_scripts if script1 != script2}
+        # Zero-width matches at the boundary (rather than matching the punctuation/digit run itself)
+        # avoid quadratic backtracking on long runs of digits that are not adjacent to Arabic characters.
+        # Both boundary directions (punct/digit-Arabic and Arabic-punct/digit) are covered in a single pass.
+        self.repair_tok_arabic_boundary_match = re.compile(r"(?<=[-_+*|%0-9])(?=[\u0600-\u06FF])"
+                                                           r"|(?<=[\u0600-\u06FF])(?=[-_+*|%0-9])")
+        self.georgian_intab = georgian_intab
+        self.georgian_outtab = georgian_outtab
+        self.georgian_trantab = georgian_trantab
 
     def windows1252_to_utf8_char(self, index: int) -> str:
         """ Typical input: 0x80       Typical output: '€' """
         s = chr(index)
-        if s in self.spec_windows1252_to_utf8_dict:
-            return self.spec_windows1252_to_utf8_dict[s]
-        else:
-            return s
+        return self.spec_windows1252_to_utf8_dict.get(s, s)
 
     def set_mapping_dict(self, key: str, value: str, index: int, byte_string: Optional[bytes], loc: str,
                          verbose: bool = False) -> None:
@@ -275,166 +549,140 @@ class Wildebeest:
         if verbose:
             log.info(f'map-{loc} {index} {key} -> {value}   byte_string:{byte_string}')
 
+    def add_char_type(self, code_points: Iterable[int], bit_vector: int) -> None:
+        """Adds character type bit_vector to the char_type_vector_dict entries of the given code points."""
+        char_type_vector_dict = self.char_type_vector_dict
+        for char in map(chr, code_points):
+            char_type_vector_dict[char] = char_type_vector_dict.get(char, 0) | bit_vector
+
+    def init_char_tables(self) -> None:
+        """Initializes char_type_vector_dict and mapping_dict. As they are the same for all Wildebeest instances,
+        they are built (incl. reading the mapping files) only once per process, and copied for further instances."""
+        if char_tables_cache:
+            self.char_type_vector_dict = char_tables_cache['char_type_vector_dict'].copy()
+            self.mapping_dict = char_tables_cache['mapping_dict'].copy()
+            self.char_type_vector_pages = char_tables_cache['char_type_vector_pages']
+            self.char_script_dict = char_tables_cache['char_script_dict']
+            return
+        self.range_init_char_type_vector_dict()
+        self.init_mapping_dict()
+        # Two-level table indexed by code point (read-only, shared by all instances), as list indexing is faster than
+        # dict.get in set_lv's per-character loop: one page of 256 character type vectors per code_point >> 8,
+        # with a single shared page of zeros for all pages without any typed character (keeps the table small).
+        zero_page = [0] * 0x100
+        self.char_type_vector_pages = [zero_page] * 0x1100
+        for char, char_type_vector in self.char_type_vector_dict.items():
+            if len(char) == 1:
+                code_point = ord(char)
+                page = self.char_type_vector_pages[code_point >> 8]
+                if page is zero_page:
+                    page = self.char_type_vector_pages[code_point >> 8] = [0] * 0x100
+                page[code_point & 0xFF] = char_type_vector
+        # Look-alike script (Latin, Greek, Cyrillic) by character (read-only, shared by all instances), see char_script.
+        self.char_script_dict = {}
+        for char, char_type_vector in self.char_type_vector_dict.items():
+            for script_bit_vector, script in ((self.char_is_latin, 'Latin'), (self.char_is_greek, 'Greek'),
+                                              (self.char_is_cyrillic, 'Cyrillic')):
+                if char_type_vector & script_bit_vector:
+                    self.char_script_dict[char] = script
+                    break
+        char_tables_cache['char_type_vector_dict'] = self.char_type_vector_dict.copy()
+        char_tables_cache['mapping_dict'] = self.mapping_dict.copy()
+        char_tables_cache['char_type_vector_pages'] = self.char_type_vector_pages
+        char_tables_cache['char_script_dict'] = self.char_script_dict
+
     def range_init_char_type_vector_dict(self) -> None:
         # Deletable control characters
-        for code_point in chain(range(0x0000, 0x0009), range(0x000B, 0x000D), range(0x000E, 0x0020), [0x007F],  # C0
-                                range(0x0080, 0x00A0),     # C1 block of control characters
-                                range(0xFE00, 0xFE10),     # variation selectors 1-16
-                                range(0xE0100, 0xE01F0)):  # variation selectors 17-256
-            char = chr(code_point)
-            self.char_type_vector_dict[char] \
-                = self.char_type_vector_dict.get(char, 0) | self.char_is_deletable_control_character
+        self.add_char_type(chain(range(0x0000, 0x0009), range(0x000B, 0x000D), range(0x000E, 0x0020), [0x007F],  # C0
+                                 range(0x0080, 0x00A0),     # C1 block of control characters
+                                 range(0xFE00, 0xFE10),     # variation selectors 1-16
+                                 range(0xE0100, 0xE01F0)),  # variation selectors 17-256
+                           self.char_is_deletable_control_character)
         # Zero-width characters
-        for code_point in chain(range(0x200B, 0x2010),     # zero width space/non-joiner/joiner, direction marks
-                                [0xFEFF]):                 # byte order mark, zero width no-break space
-            char = chr(code_point)
-            self.char_type_vector_dict[char] \
-                = self.char_type_vector_dict.get(char, 0) | self.char_is_zero_width_character
+        self.add_char_type(chain(range(0x200B, 0x2010),     # zero width space/non-joiner/joiner, direction marks
+                                 [0xFEFF]),                 # byte order mark, zero width no-break space
+                           self.char_is_zero_width_character)
         # Arabic tatweel
-        char = chr(0x0640)
-        self.char_type_vector_dict[char] = self.char_type_vector_dict.get(char, 0) | self.char_is_arabic_tatweel
+        self.add_char_type([0x0640], self.char_is_arabic_tatweel)
         # Surrogate
-        for code_point in range(0xDC80, 0xDD00):
-            char = chr(code_point)
-            self.char_type_vector_dict[char] \
-                = self.char_type_vector_dict.get(char, 0) | self.char_is_surrogate
+        self.add_char_type(range(0xDC80, 0xDD00), self.char_is_surrogate)
         # Decomposable ligatures (partial list)
-        for code_point in [0x0E33, 0x0EB3, 0x0EDC, 0x0EDD, 0x1E9B]:
-            char = chr(code_point)
-            self.char_type_vector_dict[char] \
-                = self.char_type_vector_dict.get(char, 0) | self.char_is_decomposable_ligature
+        self.add_char_type([0x0E33, 0x0EB3, 0x0EDC, 0x0EDD, 0x1E9B], self.char_is_decomposable_ligature)
         # Decomposable dash
-        for code_point in chain([0x00AD],
-                                range(0x2010, 0x2016),
-                                [0x2212, 0x2500, 0x2501, 0x2E3A, 0x2E3B, 0xFE31, 0xFE32, 0xFE58, 0xFE63, 0xFF0D]):
-            char = chr(code_point)
-            self.char_type_vector_dict[char] \
-                = self.char_type_vector_dict.get(char, 0) | self.char_is_decomposable_dash
+        self.add_char_type(chain([0x00AD],
+                                 range(0x2010, 0x2016),
+                                 [0x2212, 0x2500, 0x2501, 0x2E3A, 0x2E3B, 0xFE31, 0xFE32, 0xFE58, 0xFE63, 0xFF0D]),
+                           self.char_is_decomposable_dash)
         # Decomposable non-zero space
-        for code_point in chain(range(0x2000, 0x200B), [0x00A0, 0x202F, 0x205F, 0x3000]):
-            char = chr(code_point)
-            self.char_type_vector_dict[char] \
-                = self.char_type_vector_dict.get(char, 0) | self.char_is_decomposable_non_zero_space
+        self.add_char_type(chain(range(0x2000, 0x200B), [0x00A0, 0x202F, 0x205F, 0x3000]),
+                           self.char_is_decomposable_non_zero_space)
         # Detachable from token
-        for char in ['0', '1', '2', '3', '4', '5', '6', '7', '8', '9', '-', '_', '+', '*', '|', '%']:
-            self.char_type_vector_dict[char] \
-                = self.char_type_vector_dict.get(char, 0) | self.char_is_detachable_from_token
+        self.add_char_type(map(ord, '0123456789-_+*|%'), self.char_is_detachable_from_token)
         # XML, URL escapes
-        self.char_type_vector_dict['&'] = self.char_type_vector_dict.get('&', 0) | self.char_is_ampersand
-        self.char_type_vector_dict[';'] = self.char_type_vector_dict.get(';', 0) | self.char_is_semicolon
-        self.char_type_vector_dict['%'] = self.char_type_vector_dict.get('%', 0) | self.char_is_percent_sign
+        self.add_char_type([ord('&')], self.char_is_ampersand)
+        self.add_char_type([ord(';')], self.char_is_semicolon)
+        self.add_char_type([ord('%')], self.char_is_percent_sign)
         # Fullwidth, halfwidth
-        for code_point in range(0xFF01, 0xFFEF):
-            char = chr(code_point)
-            self.char_type_vector_dict[char] \
-                = self.char_type_vector_dict.get(char, 0) | self.char_is_fullwidth_or_halfwidth
+        self.add_char_type(range(0xFF01, 0xFFEF), self.char_is_fullwidth_or_halfwidth)
         # Latin
-        for code_point in chain(range(0x0041, 0x005B), range(0x0061, 0x007B), range(0x00C0, 0x00D7),
-                                range(0x00D8, 0x00F7), range(0x00F8, 0x02B0), range(0x2C60, 0x2080),
-                                range(0xA720, 0xA800), range(0xAB30, 0xAB70)):
-            char = chr(code_point)
-            self.char_type_vector_dict[char] \
-                = self.char_type_vector_dict.get(char, 0) | self.char_is_latin
+        self.add_char_type(chain(range(0x0041, 0x005B), range(0x0061, 0x007B), range(0x00C0, 0x00D7),
+                                 range(0x00D8, 0x00F7), range(0x00F8, 0x02B0), range(0x2C60, 0x2080),
+                                 range(0xA720, 0xA800), range(0xAB30, 0xAB70)),
+                           self.char_is_latin)
         # Greek
-        for code_point in chain(range(0x0370, 0x0400), range(0x1F00, 0x2000)):
-            char = chr(code_point)
-            self.char_type_vector_dict[char] \
-                = self.char_type_vector_dict.get(char, 0) | self.char_is_greek
+        self.add_char_type(chain(range(0x0370, 0x0400), range(0x1F00, 0x2000)), self.char_is_greek)
         # Cyrillic
-        for code_point in chain(range(0x0400, 0x0530), range(0x1C80, 0x1C90), range(0x2DE0, 0x2E00),
-                                range(0xA640, 0xA6A0)):
-            char = chr(code_point)
-            self.char_type_vector_dict[char] \
-                = self.char_type_vector_dict.get(char, 0) | self.char_is_cyrillic
+        self.add_char_type(chain(range(0x0400, 0x0530), range(0x1C80, 0x1C90), range(0x2DE0, 0x2E00),
+                                 range(0xA640, 0xA6A0)),
+                           self.char_is_cyrillic)
         # Hebrew
-        for code_point in chain(range(0x0590, 0x0600), range(0xFB1D, 0xFB50)):
-            char = chr(code_point)
-            self.char_type_vector_dict[char] \
-                = self.char_type_vector_dict.get(char, 0) | self.char_is_hebrew
-        for code_point in chain(range(0x05B0, 0x05BE), [0x05BF, 0x05C1, 0x05C2, 0x05C7]):
-            char = chr(code_point)
-            self.char_type_vector_dict[char] \
-                = self.char_type_vector_dict.get(char, 0) | self.char_is_deletable_hebrew_diacritic
+        self.add_char_type(chain(range(0x0590, 0x0600), range(0xFB1D, 0xFB50)), self.char_is_hebrew)
+        self.add_char_type(chain(range(0x05B0, 0x05BE), [0x05BF, 0x05C1, 0x05C2, 0x05C7]),
+                           self.char_is_deletable_hebrew_diacritic)
         # Arabic
-        for code_point in chain(range(0x0600, 0x0700), range(0x0750, 0x0780), range(0x08A0, 0x0900)):
-            char = chr(code_point)
-            self.char_type_vector_dict[char] \
-                = self.char_type_vector_dict.get(char, 0) | self.char_is_arabic
-        for code_point in chain(range(0xFB50, 0xFE00), range(0xFE70, 0xFEFF)):
-            char = chr(code_point)
-            self.char_type_vector_dict[char] \
-                = self.char_type_vector_dict.get(char, 0) | self.char_is_arabic | self.char_is_arabic_presentation_form
-        for code_point in range(0x064B, 0x0653):
-            char = chr(code_point)
-            self.char_type_vector_dict[char] \
-                = self.char_type_vector_dict.get(char, 0) | self.char_is_deletable_arabic_diacritic
-        for code_point in [0x06A9, 0x06CC, 0x0675, 0x0676, 0x0678, 0x067C, 0x0689, 0x0693, 0x06AB, 0x06BC, 0x06CD]:
-            char = chr(code_point)
-            self.char_type_vector_dict[char] \
-                = self.char_type_vector_dict.get(char, 0) | self.char_is_mappable_in_arabic
-        for code_point in [0x064A, 0x0649, 0x06CD, 0x0643, 0x06AB, 0x067C, 0x0689, 0x0693, 0x06BC, 0x06CD]:
-            char = chr(code_point)
-            self.char_type_vector_dict[char] \
-                = self.char_type_vector_dict.get(char, 0) | self.char_is_mappable_in_farsi
-        for code_point in [0x0649, 0x06CD, 0x0643]:
-            char = chr(code_point)
-            self.char_type_vector_dict[char] \
-                = self.char_type_vector_dict.get(char, 0) | self.char_is_mappable_in_pashto
+        self.add_char_type(chain(range(0x0600, 0x0700), range(0x0750, 0x0780), range(0x08A0, 0x0900)),
+                           self.char_is_arabic)
+        self.add_char_type(chain(range(0xFB50, 0xFE00), range(0xFE70, 0xFEFF)),
+                           self.char_is_arabic | self.char_is_arabic_presentation_form)
+        self.add_char_type(range(0x064B, 0x0653), self.char_is_deletable_arabic_diacritic)
+        self.add_char_type([0x06A9, 0x06CC, 0x0675, 0x0676, 0x0678, 0x067C, 0x0689, 0x0693, 0x06AB, 0x06BC, 0x06CD],
+                           self.char_is_mappable_in_arabic)
+        self.add_char_type([0x064A, 0x0649, 0x06CD, 0x0643, 0x06AB, 0x067C, 0x0689, 0x0693, 0x06BC, 0x06CD],
+                           self.char_is_mappable_in_farsi)
+        self.add_char_type([0x0649, 0x06CD, 0x0643], self.char_is_mappable_in_pashto)
         # Georgian
-        for code_point in chain(range(0x10A0, 0x10FF), range(0x1C90, 0x1CBF), range(0x2D00, 0x2D2F)):
-            char = chr(code_point)
-            self.char_type_vector_dict[char] \
-                = self.char_type_vector_dict.get(char, 0) | self.char_is_georgian
+        self.add_char_type(chain(range(0x10A0, 0x10FF), range(0x1C90, 0x1CBF), range(0x2D00, 0x2D2F)),
+                           self.char_is_georgian)
         # Thaana+
-        for code_point in range(0x0780, 0x08A0):
-            char = chr(code_point)
-            self.char_type_vector_dict[char] \
-                = self.char_type_vector_dict.get(char, 0) | self.char_is_thaana_plus
+        self.add_char_type(range(0x0780, 0x08A0), self.char_is_thaana_plus)
         # Devanagari
-        for code_point in chain(range(0x0900, 0x0980), range(0xA8E0, 0xA900)):
-            char = chr(code_point)
-            self.char_type_vector_dict[char] \
-                = self.char_type_vector_dict.get(char, 0) | self.char_is_devanagari
+        self.add_char_type(chain(range(0x0900, 0x0980), range(0xA8E0, 0xA900)), self.char_is_devanagari)
         # Bengali+
-        for code_point in range(0x0980, 0x0E00):
-            char = chr(code_point)
-            self.char_type_vector_dict[char] \
-                = self.char_type_vector_dict.get(char, 0) | self.char_is_bengali_plus
+        self.add_char_type(range(0x0980, 0x0E00), self.char_is_bengali_plus)
         # Nukta
-        for code_point in [0x093C, 0x09BC, 0x0A3C, 0x0ABC, 0x0B3C, 0x0CBC, 0x1C37, 0x110BA, 0x11173, 0x111CA, 0x11236,
-                           0x112E9, 0x1133C, 0x11446, 0x114C3, 0x115C0, 0x116B7, 0x1183A, 0x11943, 0x11D42, 0x1E94A]:
-            char = chr(code_point)
-            self.char_type_vector_dict[char] \
-                = self.char_type_vector_dict.get(char, 0) | self.char_is_nukta
-            if code_point >= 0x10000:
-                self.char_type_vector_dict[char] \
-                    = self.char_type_vector_dict.get(char, 0) | self.char_is_100_plus_block_of_interest
+        nukta_code_points = [0x093C, 0x09BC, 0x0A3C, 0x0ABC, 0x0B3C, 0x0CBC, 0x1C37, 0x110BA, 0x11173, 0x111CA,
+                             0x11236, 0x112E9, 0x1133C, 0x11446, 0x114C3, 0x115C0, 0x116B7, 0x1183A, 0x11943,
+                             0x11D42, 0x1E94A]
+        self.add_char_type(nukta_code_points, self.char_is_nukta)
+        self.add_char_type([code_point for code_point in nukta_code_points if code_point >= 0x10000],
+                           self.char_is_100_plus_block_of_interest)
         # Thai+
-        for code_point in range(0x0E00, 0x1100):
-            char = chr(code_point)
-            self.char_type_vector_dict[char] \
-                = self.char_type_vector_dict.get(char, 0) | self.char_is_thai_plus
+        self.add_char_type(range(0x0E00, 0x1100), self.char_is_thai_plus)
         # Korean
-        for code_point in range(0x1161, 0x1176):
-            char = chr(code_point)
-            self.char_type_vector_dict[char] \
-                = self.char_type_vector_dict.get(char, 0) | self.char_is_mappable_hangul
+        self.add_char_type(range(0x1161, 0x1176), self.char_is_mappable_hangul)
         # Khmer+
-        for code_point in chain(range(0x1780, 0x1AB0), range(0x1B00, 0x1C80), range(0x1CC0, 0x1CD0)):
-            char = chr(code_point)
-            self.char_type_vector_dict[char] \
-                = self.char_type_vector_dict.get(char, 0) | self.char_is_khmer_plus
+        self.add_char_type(chain(range(0x1780, 0x1AB0), range(0x1B00, 0x1C80), range(0x1CC0, 0x1CD0)),
+                           self.char_is_khmer_plus)
         # Lisu+
-        for code_point in chain(range(0xA4D0, 0xA630), range(0xA6A0, 0xA700), range(0xA800, 0xA830),
-                                range(0xA840, 0xA8E0), range(0xA900, 0xA960), range(0xA980, 0xA9E0),
-                                range(0xAA00, 0xAA60), range(0xAA80, 0xAB00)):
-            char = chr(code_point)
-            self.char_type_vector_dict[char] \
-                = self.char_type_vector_dict.get(char, 0) | self.char_is_lisu_plus
+        self.add_char_type(chain(range(0xA4D0, 0xA630), range(0xA6A0, 0xA700), range(0xA800, 0xA830),
+                                 range(0xA840, 0xA8E0), range(0xA900, 0xA960), range(0xA980, 0xA9E0),
+                                 range(0xAA00, 0xAA60), range(0xAA80, 0xAB00)),
+                           self.char_is_lisu_plus)
 
     def load_look_alike_file(self) -> None:
         """Loads entries of characters that look alike, e.g. 'AΑА' (Latin A, Greek Α, Cyrillic А respectively)"""
         look_alike_filename = os.path.join(data_dir_path, 'look-alikes.txt')
+        self.look_alike_token_cache = {}  # cached results depend on the look-alike entries
         line_number = 0
         n_entries = 0
         look_alike_category = None
@@ -443,15 +691,15 @@ class Wildebeest:
                 line_number += 1
                 line_contains_entry = False
                 script_dict = {}  # local mapping from script (e.g. Latin|Greek|Cyrillic) to character (e.g. w|θ|ж)
-                if re.search('::section', line):
-                    if re.search('Identical-looking characters', line):
+                if '::section' in line:
+                    if 'Identical-looking characters' in line:
                         look_alike_category = 'identical'
-                    elif re.search('Similar-looking characters', line):
+                    elif 'Similar-looking characters' in line:
                         look_alike_category = 'similar'
                     else:
                         look_alike_category = None
                 else:
-                    char_list = re.split(r'\s+', line.rstrip())
+                    char_list = line.split()
                     if look_alike_category == 'identical':
                         for char in char_list:
                             script = self.char_script(char)
@@ -465,90 +713,107 @@ class Wildebeest:
                                         char2 = script_dict.get(script2, None)
                                         if char2:
                                             self.look_alike_dict[f'{script1} {script2} {char1}'] = char2
+                                            self.look_alike_script_pair_dict[(script1, script2)][char1] = char2
                                             line_contains_entry = True
                 if line_contains_entry:
                     n_entries += 1
             # log.info(f'Loaded {n_entries} entries from {look_alike_filename}')
 
     def update_char_type_vector_dict(self, source: str, target: str, filename_core: str) -> None:
-        if filename_core == 'Digit':
+        if update_function := self.char_type_vector_update_functions().get(filename_core):
+            update_function(source, target)
+
+    def char_type_vector_update_functions(self) -> dict:
+        """Maps the core of a mapping filename (e.g. 'Digit' for DigitMapping.tsv) to the function that updates
+        char_type_vector_dict for an entry (source, target) of that file."""
+        return {'Digit': self.update_char_type_vector_dict_for_digit,
+                'FontSmallVertical': self.update_char_type_vector_dict_for_font_small_vertical,
+                'CoreCompatibility': self.update_char_type_vector_dict_for_core_compatibility,
+                'CJKCompatibility': self.update_char_type_vector_dict_for_cjk_compatibility,
+                'PythonWildebeest': self.update_char_type_vector_dict_for_python_wildebeest,
+                'Enclosure': self.update_char_type_vector_dict_for_enclosure,
+                'EncodingRepair': self.update_char_type_vector_dict_for_encoding_repair,
+                'CombiningModifier': self.update_char_type_vector_dict_for_combining_modifier}
+
+    def update_char_type_vector_dict_for_digit(self, source: str, _target: str) -> None:
+        self.char_type_vector_dict[source] \
+            = self.char_type_vector_dict.get(source, 0) | self.char_is_mappable_decimal_digit
+        if len(source) >= 1 and ord(source[0]) >= 0x10000:
             self.char_type_vector_dict[source] \
-                = self.char_type_vector_dict.get(source, 0) | self.char_is_mappable_decimal_digit
-            if len(source) >= 1 and ord(source[0]) >= 0x10000:
+                = self.char_type_vector_dict.get(source, 0) | self.char_is_100_plus_block_of_interest
+
+    def update_char_type_vector_dict_for_font_small_vertical(self, source: str, _target: str) -> None:
+        self.char_type_vector_dict[source] \
+            = self.char_type_vector_dict.get(source, 0) | self.char_is_font_small_vertical
+
+    def update_char_type_vector_dict_for_core_compatibility(self, source: str, _target: str) -> None:
+        self.char_type_vector_dict[source] \
+            = self.char_type_vector_dict.get(source, 0) | self.char_is_core_compatibility
+
+    def update_char_type_vector_dict_for_cjk_compatibility(self, source: str, _target: str) -> None:
+        self.char_type_vector_dict[source] \
+            = self.char_type_vector_dict.get(source, 0) | self.char_is_decomposable_cjk
+
+    def update_char_type_vector_dict_for_python_wildebeest(self, source: str, _target: str) -> None:
+        if len(source) == 1:
+            code_point = ord(source)
+            if (0x0132 <= code_point <= 0x01F3) or (0xFB00 <= code_point <= 0xFB4F):
                 self.char_type_vector_dict[source] \
-                    = self.char_type_vector_dict.get(source, 0) | self.char_is_100_plus_block_of_interest
-        elif filename_core == 'FontSmallVertical':
-            self.char_type_vector_dict[source] \
-                = self.char_type_vector_dict.get(source, 0) | self.char_is_font_small_vertical
-        elif filename_core == 'CoreCompatibility':
-            self.char_type_vector_dict[source] \
-                = self.char_type_vector_dict.get(source, 0) | self.char_is_core_compatibility
-        elif filename_core == 'CJKCompatibility':
-            self.char_type_vector_dict[source] \
-                = self.char_type_vector_dict.get(source, 0) | self.char_is_decomposable_cjk
-        elif filename_core == 'PythonWildebeest':
-            if len(source) == 1:
-                code_point = ord(source)
-                if (0x0132 <= code_point <= 0x01F3) or (0xFB00 <= code_point <= 0xFB4F):
-                    self.char_type_vector_dict[source] \
-                        = self.char_type_vector_dict.get(source, 0) | self.char_is_decomposable_ligature
-                elif (code_point == 0x00B5) or (0x03D0 <= code_point <= 0x03F9) or (0x20A8 <= code_point <= 0x213B):
-                    self.char_type_vector_dict[source] \
-                        = self.char_type_vector_dict.get(source, 0) | self.char_is_decomposable_sign_symbol
-                elif 0x0340 <= code_point <= 0x0387:
-                    self.char_type_vector_dict[source] \
-                        = self.char_type_vector_dict.get(source, 0) | self.char_is_decomposable_greek_punctuation
-                elif 0x060C <= code_point <= 0x06D4:
-                    self.char_type_vector_dict[source] \
-                        = self.char_type_vector_dict.get(source, 0) | self.char_is_decomposable_arabic_punctuation
-                elif ((0x3008 <= code_point <= 0x3011) or (0x3014 <= code_point <= 0x301B)  # Chinese brackets
-                        or (0xFF61 <= code_point <= 0xFF64)  # Chinese halfwidth punctuation
-                        or (code_point in [0x3001, 0x3002, 0xFE11, 0xFE12, 0xFE51])):  # periods, commas
-                    self.char_type_vector_dict[source] \
-                        = self.char_type_vector_dict.get(source, 0) | self.char_is_decomposable_cjk_punctuation
-                elif code_point == 0x0F0C:
-                    self.char_type_vector_dict[source] \
-                        = self.char_type_vector_dict.get(source, 0) | self.char_is_decomposable_misc_f_punctuation
-        elif filename_core == 'Enclosure':
-            if len(source) >= 1:
-                char = source[0]
-                self.char_type_vector_dict[char] \
-                    = self.char_type_vector_dict.get(char, 0) | self.char_is_decomposable_enclosure
-        elif filename_core == 'EncodingRepair':
-            if len(source) >= 1:
-                char = source[0]
-                self.char_type_vector_dict[char] \
-                    = self.char_type_vector_dict.get(char, 0) | self.char_is_encoding_repair_anchor
-        elif filename_core == 'CombiningModifier':
-            if len(source) == 1:
+                    = self.char_type_vector_dict.get(source, 0) | self.char_is_decomposable_ligature
+            elif (code_point == 0x00B5) or (0x03D0 <= code_point <= 0x03F9) or (0x20A8 <= code_point <= 0x213B):
                 self.char_type_vector_dict[source] \
-                    = self.char_type_vector_dict.get(source, 0) | self.char_is_decomposable_with_combining
-            elif (len(source) >= 2) and (len(target) == 1):
-                self.char_type_vector_dict[source[0]] \
-                    = self.char_type_vector_dict.get(source[0], 0) | self.char_is_composable_anchor_with_combining
-                self.char_type_vector_dict[source[1]] \
-                    = self.char_type_vector_dict.get(source[1], 0) | self.char_is_composable_combining_diacritic
-            else:
-                log.info('Unexpected CombiningModifier entry {source}/{target}')
+                    = self.char_type_vector_dict.get(source, 0) | self.char_is_decomposable_sign_symbol
+            elif 0x0340 <= code_point <= 0x0387:
+                self.char_type_vector_dict[source] \
+                    = self.char_type_vector_dict.get(source, 0) | self.char_is_decomposable_greek_punctuation
+            elif 0x060C <= code_point <= 0x06D4:
+                self.char_type_vector_dict[source] \
+                    = self.char_type_vector_dict.get(source, 0) | self.char_is_decomposable_arabic_punctuation
+            elif ((0x3008 <= code_point <= 0x3011) or (0x3014 <= code_point <= 0x301B)  # Chinese brackets
+                    or (0xFF61 <= code_point <= 0xFF64)  # Chinese halfwidth punctuation
+                    or (code_point in [0x3001, 0x3002, 0xFE11, 0xFE12, 0xFE51])):  # periods, commas
+                self.char_type_vector_dict[source] \
+                    = self.char_type_vector_dict.get(source, 0) | self.char_is_decomposable_cjk_punctuation
+            elif code_point == 0x0F0C:
+                self.char_type_vector_dict[source] \
+                    = self.char_type_vector_dict.get(source, 0) | self.char_is_decomposable_misc_f_punctuation
+
+    def update_char_type_vector_dict_for_enclosure(self, source: str, _target: str) -> None:
+        if len(source) >= 1:
+            char = source[0]
+            self.char_type_vector_dict[char] \
+                = self.char_type_vector_dict.get(char, 0) | self.char_is_decomposable_enclosure
+
+    def update_char_type_vector_dict_for_encoding_repair(self, source: str, _target: str) -> None:
+        if len(source) >= 1:
+            char = source[0]
+            self.char_type_vector_dict[char] \
+                = self.char_type_vector_dict.get(char, 0) | self.char_is_encoding_repair_anchor
+
+    def update_char_type_vector_dict_for_combining_modifier(self, source: str, target: str) -> None:
+        if len(source) == 1:
+            self.char_type_vector_dict[source] \
+                = self.char_type_vector_dict.get(source, 0) | self.char_is_decomposable_with_combining
+        elif (len(source) >= 2) and (len(target) == 1):
+            self.char_type_vector_dict[source[0]] \
+                = self.char_type_vector_dict.get(source[0], 0) | self.char_is_composable_anchor_with_combining
+            self.char_type_vector_dict[source[1]] \
+                = self.char_type_vector_dict.get(source[1], 0) | self.char_is_composable_combining_diacritic
+        else:
+            log.info('Unexpected CombiningModifier entry {source}/{target}')
 
     # noinspection SpellCheckingInspection
     def init_mapping_dict(self, undef_default: str = '') -> None:
         """Initialize mapping_dict that maps from various misencodings to proper UTF8."""
         # Misencodings that resulted from missing conversion from Windows1252/Latin1 to UTF8.
         # Control characters section in surrogate code block
-        for index in range(0x80, 0xA0):
-            spec_windows1252_char = chr(index)
-            surrogate_char = chr(index + 0xDC00)
-            if spec_windows1252_char in self.spec_windows1252_to_utf8_dict:
-                self.set_mapping_dict(surrogate_char, self.spec_windows1252_to_utf8_dict[spec_windows1252_char],
-                                      index, None, 's1')
-            else:  # x81,x8D,x8F,x90,x9D
-                self.set_mapping_dict(surrogate_char, undef_default, index, None, 's2')
+        # Bulk updates (rather than set_mapping_dict, which can also log each entry) keep init lean.
+        spec_windows1252_to_utf8_dict = self.spec_windows1252_to_utf8_dict
+        self.mapping_dict.update({chr(index + 0xDC00): spec_windows1252_to_utf8_dict.get(chr(index), undef_default)
+                                  for index in range(0x80, 0xA0)})  # undefined: x81,x8D,x8F,x90,x9D
         # Other characters in surrogate code block
-        for index in range(0xA0, 0x100):
-            latin1_char = chr(index)
-            surrogate_char = chr(index + 0xDC00)
-            self.set_mapping_dict(surrogate_char, latin1_char, index, None, 's3')
+        self.mapping_dict.update({chr(index + 0xDC00): chr(index) for index in range(0xA0, 0x100)})
+        char_type_vector_update_functions = self.char_type_vector_update_functions()
         for tsv_filename in ('PythonWildebeestMapping.tsv',
                              'ArabicPresentationFormMapping.tsv',
                              'CJKCompatibilityMapping.tsv',
@@ -559,6 +824,8 @@ class Wildebeest:
                              'EncodingRepairMapping.tsv',
                              'FontSmallVerticalMapping.tsv'):
             filename_core = tsv_filename.replace('Mapping.tsv', '')
+            # Resolved once per file rather than per entry (ArabicPresentationForm has no character types).
+            update_char_type_vector_dict = char_type_vector_update_functions.get(filename_core)
             full_tsv_filename = os.path.join(data_dir_path, tsv_filename)
             filenames_considered = [full_tsv_filename]
             if not Path(full_tsv_filename).is_file():
@@ -566,23 +833,21 @@ class Wildebeest:
                 filenames_considered += [full_tsv_filename]
             try:
                 with open(full_tsv_filename, 'r', encoding='utf-8', errors='ignore') as f:
-                    line_number = 0
+                    next(f, None)  # skip header line
                     for line in f:
-                        line_number += 1
-                        tsv_list = re.split(r'\t', line.rstrip())
-                        if (len(tsv_list) >= 2) and (line_number >= 2):
-                            self.mapping_dict[tsv_list[0]] = tsv_list[1]
-                            self.update_char_type_vector_dict(tsv_list[0], tsv_list[1], filename_core)
+                        tsv_list = line.rstrip().split('\t')
+                        if len(tsv_list) >= 2:
+                            # Interned, so that the many repeated targets (e.g. 'a') share a single string object.
+                            self.mapping_dict[tsv_list[0]] = sys.intern(tsv_list[1])
+                            if update_char_type_vector_dict:
+                                update_char_type_vector_dict(tsv_list[0], tsv_list[1])
             except FileNotFoundError:
                 log.error(f"Could not open {' or '.join(filenames_considered)}")
 
     def apply_mapping_dict(self, match: Match[str]) -> str:
         """Maps substring resulting from misencoding to repaired UTF8."""
         s = match.group()
-        if s in self.mapping_dict:
-            return self.mapping_dict[s]
-        else:
-            return s
+        return self.mapping_dict.get(s, s)
 
     # noinspection SpellCheckingInspection
     def repair_encoding_errors(self, s: str) -> str:
@@ -592,24 +857,24 @@ class Wildebeest:
         are encoded identically in UTF-8, Latin-1, and Windows-1252, so no conversion is necessary in that case.
         """
         # Correct missing conversion to UTF8
-        s = re.sub(r'[\uDC80-\uDCFF]', self.apply_mapping_dict, s)
+        s = surrogate_re.sub(self.mapping_dict_repl, s)
         # Correct UTF8 misencodings due to wrong or double application of Windows1252/Latin1-to-UTF converter
-        s = re.sub(r'\u00E2[\u0080-\u00BF][\u0080-\u00BF]', self.apply_mapping_dict, s)
-        s = re.sub(r'[\u00C2-\u00C3\u00C5\u00C6\u00CB][\u0080-\u02FF\u2000-\u21FF]', self.apply_mapping_dict, s)
-        s = re.sub(r'[\u0080-\u009F]', self.apply_mapping_dict, s)
+        s = misencoded_utf8_3_byte_re.sub(self.mapping_dict_repl, s)
+        s = misencoded_utf8_2_byte_re.sub(self.mapping_dict_repl, s)
+        s = c1_control_character_re.sub(self.mapping_dict_repl, s)
         return s
 
     # noinspection SpellCheckingInspection
     @staticmethod
     def delete_surrogates(s: str, default: str = '') -> str:
         """As an alternative or backup to windows1252_to_utf8, delete all surrogate characters \uDC80-\uDCFF])."""
-        return re.sub(r"[\uDC80-\uDCFF]", default, s)
+        return surrogate_re.sub(default, s)
 
     @staticmethod
     def delete_zero_width_characters(s: str) -> str:
         """Deletes zero-width characters, byte order mark, directional marks, join marks"""
         s = s.replace('\u00AD', '')  # U+00AD soft hyphen
-        s = re.sub(r'[\u200B-\u200F]', '', s)  # zero width space/non-joiner/joiner, direction marks
+        s = zero_width_character_re.sub('', s)  # zero width space/non-joiner/joiner, direction marks
         # noinspection SpellCheckingInspection
         s = s.replace('\uFEFF', '')  # byte order mark, zero width no-break space
         return s
@@ -623,18 +888,16 @@ class Wildebeest:
     @staticmethod
     def delete_control_characters(s: str) -> str:
         """Deletes control characters (except tab and linefeed), some variation selectors"""
-        s = re.sub(r'[\u0000-\u0008]', '', s)  # control characters C0 code block (except tab \x09, linefeed \x0A)
-        s = re.sub(r'[\u000B-\u000C]', '', s)  # control characters C0 code block (continued, except CR \x0D)
-        s = re.sub(r'[\u000E-\u001F]', '', s)  # control characters C0 code block (continued)
-        s = re.sub(r'[\u007F-\u009F]', '', s)  # control characters 'DELETE' and C1 code block
+        s = deletable_control_character_re.sub('', s)
         # Remove variation selectors that follow most letters, numbers, punctuation. Keep after emoji etc.
-        s = re.sub(r'(?<=[\u0000-\u218F])[\uFE00-\uFE0F]', '', s)  # variation selectors 1-16
-        s = re.sub(r'(?<=[\u0000-\u218F])[\U000E0100-\U000E01EF]', '', s)  # variation selectors 17-256
+        s = variation_selector_re.sub('', s)  # variation selectors 1-16, 17-256
         # noinspection SpellCheckingInspection
         return s
 
     @staticmethod
     def delete_arabic_diacritics(s: str) -> str:
+        if s.isascii():  # nothing to do for ASCII strings
+            return s
         s = s.replace('\u064B', '')  # delete Arabic fathatan
         s = s.replace('\u064C', '')  # delete Arabic dammatan
         s = s.replace('\u064D', '')  # delete Arabic kasratan
@@ -647,6 +910,8 @@ class Wildebeest:
 
     @staticmethod
     def delete_hebrew_diacritics(s: str) -> str:
+        if s.isascii():  # nothing to do for ASCII strings
+            return s
         s = s.replace('\u05B0', '')  # HEBREW POINT SHEVA
         s = s.replace('\u05B1', '')  # HEBREW POINT HATAF SEGOL
         s = s.replace('\u05B2', '')  # HEBREW POINT HATAF PATAH
@@ -670,6 +935,8 @@ class Wildebeest:
     # noinspection SpellCheckingInspection
     @staticmethod
     def normalize_arabic_characters(s: str) -> str:
+        if s.isascii():  # nothing to do for ASCII strings
+            return s
         # For any additions below, also update setting of char_is_mappable_in_arabic
         # Some of the below, particularly the alef maksura, might be too aggressive. Too be verified.
         #    More conservative: keep alef maksura and map final/isolated Farsi yeh to alef maksura.
@@ -691,6 +958,8 @@ class Wildebeest:
     # noinspection SpellCheckingInspection
     @staticmethod
     def normalize_farsi_characters(s: str) -> str:
+        if s.isascii():  # nothing to do for ASCII strings
+            return s
         # For any additions below, also update setting of char_is_mappable_in_farsi
         s = s.replace('\u064A', '\u06CC')  # Arabic to Farsi yeh
         s = s.replace('\u0649', '\u06CC')  # Arabic alef maksura to Farsi yeh
@@ -706,6 +975,8 @@ class Wildebeest:
 
     @staticmethod
     def normalize_pashto_characters(s: str) -> str:
+        if s.isascii():  # nothing to do for ASCII strings
+            return s
         # For any additions below, also update setting of char_is_mappable_in_pashto
         s = s.replace('\u0649', '\u06CC')  # Arabic alef maksura to Farsi yeh
         s = s.replace('\u06CD', '\u06CC')  # Arabic yeh with tail to Farsi yeh
@@ -714,6 +985,8 @@ class Wildebeest:
 
     def normalize_georgian_characters(self, s: str) -> str:
         """maps archaic Georgian letters to standard Georgian"""
+        if s.isascii():  # nothing to do for ASCII strings
+            return s
         s = s.translate(self.georgian_trantab)
         s = s.replace('ჱ', 'ე')    # archaic Georgian letter he
         s = s.replace('ჲ', 'ი')    # archaic Georgian letter hie
@@ -725,83 +998,25 @@ class Wildebeest:
     # noinspection SpellCheckingInspection
     def normalize_arabic_pres_form_characters(self, s: str) -> str:
         """This includes some Arabic ligatures."""
-        s = re.sub(r'[\uFB50-\uFDFF\uFE70-\uFEFC]', self.apply_mapping_dict, s)
+        s = arabic_pres_form_re.sub(self.mapping_dict_repl, s)
         return s
 
     # noinspection SpellCheckingInspection
     @staticmethod
     def normalize_ligatures(s: str) -> str:
         """Arabic ligatures are already covered by function normalize_arabic_pres_form_characters."""
-        s = s.replace('\u0132', '\u0049\u004A')  # U+0132 LATIN CAPITAL LIGATURE IJ Ĳ -> IJ
-        s = s.replace('\u0133', '\u0069\u006A')  # U+0133 LATIN SMALL LIGATURE IJ ĳ -> ij
-        s = s.replace('\u013F', '\u004C\u00B7')  # U+013F LATIN CAPITAL LETTER L WITH MIDDLE DOT Ŀ -> L·
-        s = s.replace('\u0140', '\u006C\u00B7')  # U+0140 LATIN SMALL LETTER L WITH MIDDLE DOT ŀ -> l·
-        s = s.replace('\u0149', '\u02BC\u006E')  # U+0149 LATIN SMALL LETTER N PRECEDED BY APOSTROPHE ŉ -> ʼn \
-        s = s.replace('\u017F', '\u0073')        # U+017F LATIN SMALL LETTER LONG S ſ -> s
-        s = s.replace('\u01C4', '\u0044\u017D')  # U+01C4 LATIN CAPITAL LETTER DZ WITH CARON Ǆ -> DŽ
-        s = s.replace('\u01C5', '\u0044\u017E')  # U+01C5 LATIN CAPITAL D WITH SMALL Z WITH CARON ǅ -> Dž
-        s = s.replace('\u01C6', '\u0064\u017E')  # U+01C6 LATIN SMALL LETTER DZ WITH CARON ǆ -> dž
-        s = s.replace('\u01C7', '\u004C\u004A')  # U+01C7 LATIN CAPITAL LETTER LJ Ǉ -> LJ
-        s = s.replace('\u01C8', '\u004C\u006A')  # U+01C8 LATIN CAPITAL LETTER L WITH SMALL LETTER J ǈ -> Lj
-        s = s.replace('\u01C9', '\u006C\u006A')  # U+01C9 LATIN SMALL LETTER LJ ǉ -> lj
-        s = s.replace('\u01CA', '\u004E\u004A')  # U+01CA LATIN CAPITAL LETTER NJ Ǌ -> NJ
-        s = s.replace('\u01CB', '\u004E\u006A')  # U+01CB LATIN CAPITAL LETTER N WITH SMALL LETTER J ǋ -> Nj
-        s = s.replace('\u01CC', '\u006E\u006A')  # U+01CC LATIN SMALL LETTER NJ ǌ -> nj
-        s = s.replace('\u01F1', '\u0044\u005A')  # U+01F1 LATIN CAPITAL LETTER DZ Ǳ -> DZ
-        s = s.replace('\u01F2', '\u0044\u007A')  # U+01F2 LATIN CAPITAL LETTER D WITH SMALL LETTER Z ǲ -> Dz
-        s = s.replace('\u01F3', '\u0064\u007A')  # U+01F3 LATIN SMALL LETTER DZ ǳ -> dz
-        s = s.replace('\u1E9B', '\u1E61')        # U+1E9B LATIN SMALL LETTER LONG S WITH DOT ABOV ẛ -> ṡ
-        s = s.replace('\uFB00', '\u0066\u0066')  # U+FB00 LATIN SMALL LIGATURE FF ﬀ -> ff
-        s = s.replace('\uFB01', '\u0066\u0069')  # U+FB01 LATIN SMALL LIGATURE FI ﬁ -> fi
-        s = s.replace('\uFB02', '\u0066\u006C')  # U+FB02 LATIN SMALL LIGATURE FL ﬂ -> fl
-        s = s.replace('\uFB03', '\u0066\u0066\u0069')  # U+FB03 LATIN SMALL LIGATURE FFI ﬃ -> ffi
-        s = s.replace('\uFB04', '\u0066\u0066\u006C')  # U+FB04 LATIN SMALL LIGATURE FFL ﬄ -> ffl
-        s = s.replace('\uFB05', '\u0073\u0074')  # U+FB05 LATIN SMALL LIGATURE LONG S T ﬅ -> ſt
-        s = s.replace('\uFB06', '\u0073\u0074')  # U+FB06 LATIN SMALL LIGATURE ST ﬆ -> st
-        s = s.replace('\uFB13', '\u0574\u0576')  # U+FB13 ARMENIAN SMALL LIGATURE MEN NOW ﬓ -> մն
-        s = s.replace('\uFB14', '\u0574\u0565')  # U+FB14 ARMENIAN SMALL LIGATURE MEN ECH ﬔ -> մե
-        s = s.replace('\uFB15', '\u0574\u056B')  # U+FB15 ARMENIAN SMALL LIGATURE MEN INI ﬕ -> մի
-        s = s.replace('\uFB16', '\u057E\u0576')  # U+FB16 ARMENIAN SMALL LIGATURE VEW NOW ﬖ -> վն
-        s = s.replace('\uFB17', '\u0574\u056D')  # U+FB17 ARMENIAN SMALL LIGATURE MEN XEH ﬗ -> մխ
-        s = s.replace('\uFB49', '\u05E9\u05BC')  # U+FB49 HEBREW LETTER SHIN WITH DAGESH שּ -> שּ
-        s = s.replace('\uFB4F', '\u05D0\u05DC')  # U+FB4F HEBREW LIGATURE ALEF LAMED ﭏ -> אל
-        return s
+        return ligature_re.sub(lambda m: ligature_dict[m.group()], s)
 
     @staticmethod
     def normalize_signs_and_symbols(s: str) -> str:
-        s = s.replace('\u00B5', '\u03BC')        # U+00B5 MICRO SIGN µ -> μ (GREEK SMALL LETTER MU)
-        s = s.replace('\u03D0', '\u03B2')        # U+03D0 GREEK BETA SYMBOL ϐ -> β
-        s = s.replace('\u03D1', '\u03B8')        # U+03D1 GREEK THETA SYMBOL ϑ -> θ
-        s = s.replace('\u03D2', '\u03A5')        # U+03D2 GREEK UPSILON WITH HOOK SYMBOL ϒ -> Υ
-        s = s.replace('\u03D3', '\u038E')        # U+03D3 GREEK UPSILON WITH ACUTE AND HOOK SYMBOL ϓ -> Ύ
-        s = s.replace('\u03D4', '\u03AB')        # U+03D4 GREEK UPSILON WITH DIAERESIS AND HOOK SYMBOL ϔ -> Ϋ
-        s = s.replace('\u03D5', '\u03C6')        # U+03D5 GREEK PHI SYMBOL ϕ -> φ
-        s = s.replace('\u03D6', '\u03C0')        # U+03D6 GREEK PI SYMBOL ϖ -> π
-        s = s.replace('\u03F0', '\u03BA')        # U+03F0 GREEK KAPPA SYMBOL ϰ -> κ
-        s = s.replace('\u03F1', '\u03C1')        # U+03F1 GREEK RHO SYMBOL ϱ -> ρ
-        s = s.replace('\u03F2', '\u03C2')        # U+03F2 GREEK LUNATE SIGMA SYMBOL ϲ -> ς
-        s = s.replace('\u03F4', '\u0398')        # U+03F4 GREEK CAPITAL THETA SYMBOL ϴ -> Θ
-        s = s.replace('\u03F5', '\u03B5')        # U+03F5 GREEK LUNATE EPSILON SYMBOL ϵ -> ε
-        s = s.replace('\u03F9', '\u03A3')        # U+03F9 GREEK CAPITAL LUNATE SIGMA SYMBOL Ϲ -> Σ
-        s = s.replace('\u20A8', 'Rs')            # U+20A8 RUPEE SIGN ₨ -> Rs
-        s = s.replace('\u2103', '\u00B0C')       # U+2103 DEGREE CELIUS ℃ -> °C
-        s = s.replace('\u2107', '\u0190')        # U+2107 EULER CONSTANT ℇ -> Ɛ
-        s = s.replace('\u2109', '\u00B0F')       # U+2109 DEGREE FAHRENHEIT ℉ -> °F
-        s = s.replace('\u2116', 'No.')           # U+2116 NUMERO SIGN № -> No.
-        s = s.replace('\u2126', '\u03A9')        # U+2126 OHM SIGN Ω -> Ω (GREEK CAPITAL LETTER OMEGA)
-        s = s.replace('\u212A', '\u004B')        # U+212A KELVIN SIGN K -> K (LATIN CAPITAL LETTER K)
-        s = s.replace('\u212B', '\u00C5')        # U+212B ANGSTROM SIGN Å -> Å (LATIN CAP. LETTER A WITH RING ABOVE)
-        s = s.replace('\u2135', '\u05D0')        # U+2135 ALEF SYMBOL ℵ -> א
-        s = s.replace('\u2136', '\u05D1')        # U+2136 BET SYMBOL ℶ -> ב
-        s = s.replace('\u2137', '\u05D2')        # U+2137 GIMEL SYMBOL ℷ -> ג
-        s = s.replace('\u2138', '\u05D3')        # U+2138 DALET SYMBOL ℸ -> ד
-        s = s.replace('\u213B', 'FAX')           # U+213B FACSIMILE SIGN ℻ -> FAX
-        return s
+        return sign_and_symbol_re.sub(lambda m: sign_and_symbol_dict[m.group()], s)
 
     def normalize_cjk(self, s: str) -> str:
+        if s.isascii():  # nothing to do for ASCII strings
+            return s
         # CJK Compatibility (e.g. ㋀ ㌀ ㍰ ㎢ ㏾ ㏿)
-        s = re.sub(r'[\u2F00-\u2FDF\u3038-\u303A\u3250\u32C0-\u33FF\uF900-\uFAFF]', self.apply_mapping_dict, s)
-        s = re.sub(r'[\U0001F190\U0001F200\U0002F800-\U0002FA1F]', self.apply_mapping_dict, s)
+        s = cjk_compatibility_re.sub(self.mapping_dict_repl, s)
+        s = cjk_compatibility_supplement_re.sub(self.mapping_dict_repl, s)
         return s
 
     def apply_combining_modifiers_compose(self, s: str) -> str:
@@ -813,13 +1028,13 @@ class Wildebeest:
         # U+0653 - U+0655 Arabic modifiers: madda above, hamza above, hamza below
         # U+3099 COMBINING KATAKANA-HIRAGANA VOICED SOUND MARK  ゙(e.g. ka -> ga)
         # U+309A COMBINING KATAKANA-HIRAGANA SEMI-VOICED SOUND MARK  ゚(e.g. ha -> pa)
-        if re.search(r'[\u0300-\u036F\u0653-\u0655\u3099\u309A]', s):
-            s = re.sub(r'.[\u0300-\u036F\u0653-\u0655\u3099\u309A]{3}', self.apply_mapping_dict, s)
-            s = re.sub(r'.[\u0300-\u036F\u0653-\u0655\u3099\u309A]{2}', self.apply_mapping_dict, s)
-            s = re.sub(r'.[\u0300-\u036F\u0653-\u0655\u3099\u309A]', self.apply_mapping_dict, s)
+        if combining_modifier_re.search(s):
+            s = char_with_3_combining_modifiers_re.sub(self.mapping_dict_repl, s)
+            s = char_with_2_combining_modifiers_re.sub(self.mapping_dict_repl, s)
+            s = char_with_1_combining_modifier_re.sub(self.mapping_dict_repl, s)
         # U+093C Devanagari sign nukta, other South Asian
-        if re.search(r'[\u093C\u09BE-\u102E\u1B35\U00011000-\U000115FF]', s):
-            s = re.sub(r'.[\u093C\u09BE-\u102E\u1B35\U00011000-\U000115FF]', self.apply_mapping_dict, s)
+        if south_asian_combining_sign_re.search(s):
+            s = char_with_south_asian_combining_sign_re.sub(self.mapping_dict_repl, s)
         # Armenian
         # Hrayr Harutyunyan confirmed that և U+0587 is (1) considered a single letter in the Armenian alphabet,
         # (2) is included on Armenian keyboards and that (3) the decomposition եւ (U+0565 U+0582) should always
@@ -830,12 +1045,9 @@ class Wildebeest:
     def apply_combining_modifiers_decompose(self, s: str) -> str:
         """Decompose character, splitting off combining/modifying character."""
         # Indic, Tibetan, Hebrew, 'forking'
-        if re.search(r'[\u0344\u0958-\u095F\u09DC-\u0B5D\u0F43-\u0FB9\u2ADC\uFB1D-\uFB4E]', s):
-            s = re.sub(r'[\u0344\u0958-\u095F\u09DC-\u0B5D\u0F43-\u0FB9\u2ADC\uFB1D-\uFB4E]', self.apply_mapping_dict,
-                       s)
+        s = decomposable_indic_tibetan_hebrew_re.sub(self.mapping_dict_repl, s)
         # Musical symbols
-        if re.search(r'[\U0001D100-\U0001D1FF]', s):
-            s = re.sub(r'[\U0001D100-\U0001D1FF]', self.apply_mapping_dict, s)
+        s = musical_symbol_re.sub(self.mapping_dict_repl, s)
         return s
 
     @staticmethod
@@ -856,49 +1068,46 @@ class Wildebeest:
         result = chr((leading_index * 588) + (vowel_index * 28) + trailing_index + 0xAC00)
         return result
 
-    def hangul_jamo_triple_match_to_syllable(self, m: Match[str]) -> str:
-        return self.hangul_jamo_triple_to_syllable(m.group(1), m.group(2), m.group(3))
+    @staticmethod
+    def hangul_jamo_triple_match_to_syllable(m: Match[str]) -> str:
+        # Same as hangul_jamo_triple_to_syllable, but inlined and without asserts, as the jamo ranges are
+        # already guaranteed by hangul_jamo_sequence_re.
+        leading_jamo, vowel_jamo, trailing_jamo = m.groups()
+        return chr((ord(leading_jamo) - 0x1100) * 588 + (ord(vowel_jamo) - 0x1161) * 28
+                   + (ord(trailing_jamo) - 0x11A7 if trailing_jamo else 0) + 0xAC00)
 
     def normalize_hangul(self, s: str) -> str:
         """Convert all Hangul jamo triples/doubles in string to Hangul syllables."""
-        if re.search(r'[\u1161-\u1175]', s):  # string includes a Hangul vowel jamo
-            s = re.sub(r'([\u1100-\u1112])([\u1161-\u1175])([\u11A8-\u11C2]|)',  # trailing jamo can be ''
-                       self.hangul_jamo_triple_match_to_syllable, s)
+        if s.isascii():  # nothing to do for ASCII strings
+            return s
+        if hangul_vowel_jamo_re.search(s):  # string includes a Hangul vowel jamo
+            s = hangul_jamo_sequence_re.sub(self.hangul_jamo_triple_match_to_syllable, s)
         return s
 
     def repair_combining_modifiers_with_nukta(self, s: str) -> str:
         """This function repairs the order of combining modifiers."""
+        if s.isascii():  # nothing to do for ASCII strings
+            return s
+        lv = self.lv
+        if not lv & self.nukta_script_mask:
+            return s
         # If an Indic vowel-sign (incl. virama) is followed by a nukta, reverse the order of the two diacritics.
-        if self.lv & self.char_is_devanagari:
-            s = re.sub(r'([\u093E-\u094D])(\u093C+)', r'\2\1', s)  # Devanagari
-            s = re.sub(r'(\u093C)\u093C+', r'\1', s)  # remove duplicate Devanagari nuktas
-        # Bengali, Gurmukhi, Gujarati, Oriya, Tamil, Telugu, Kannada, Malayalam, Sinhala
-        if self.lv & self.char_is_bengali_plus:
-            s = re.sub(r'([\u09BE-\u09CD])(\u09BC+)', r'\2\1', s)  # Bengali
-            s = re.sub(r'([\u0A3E-\u0A4D])(\u0A3C+)', r'\2\1', s)  # Gurmukhi
-            s = re.sub(r'([\u0ABE-\u0ACD])(\u0ABC+)', r'\2\1', s)  # Gujarati
-            s = re.sub(r'([\u0B3E-\u0B4D])(\u0B3C+)', r'\2\1', s)  # Oriya
-            s = re.sub(r'([\u0CBE-\u0CCD])(\u0CBC+)', r'\2\1', s)  # Kannada
-            s = re.sub(r'(\u09BC)\u09BC+', r'\1', s)  # remove duplicate Bengali nuktas
-            s = re.sub(r'(\u0A3C)\u0A3C+', r'\1', s)  # remove duplicate Gurmukhi nuktas
-            s = re.sub(r'(\u0ABC)\u0ABC+', r'\1', s)  # remove duplicate Gujarati nuktas
-            s = re.sub(r'(\u0B3C)\u0B3C+', r'\1', s)  # remove duplicate Oriya nuktas
-            s = re.sub(r'(\u0CBC)\u0CBC+', r'\1', s)  # remove duplicate Kannada nuktas
-        if self.lv & self.char_is_khmer_plus:
-            s = re.sub(r'([\u1C26-\u1C2C])(\u1C37)', r'\2\1', s)  # Lepcha
-        if self.lv & self.char_is_100_plus_block_of_interest:
-            s = re.sub(r'([\U000110B0-\U000110B8])(\U000110BA)', r'\2\1', s)  # Kaithi
-            s = re.sub(r'([\U000111B3-\U000111C0])(\U000111CA)', r'\2\1', s)  # Sharada
-            s = re.sub(r'([\U0001122C-\U00011235])(\U00011236)', r'\2\1', s)  # Khojki
-            s = re.sub(r'([\U000112E0-\U000112E8\U000112EA])(\U000112E9)', r'\2\1', s)  # Khudawadi
-            s = re.sub(r'([\U0001133E-\U0001134D])(\U0001133C)', r'\2\1', s)  # Grantha
-            s = re.sub(r'([\U00011435-\U00011442])(\U00011446)', r'\2\1', s)  # Newa
-            s = re.sub(r'([\U000114B0-\U000114C2])(\U000114C3)', r'\2\1', s)  # Tirhuta
-            s = re.sub(r'([\U000115AF-\U000115BF])(\U000115C0)', r'\2\1', s)  # Siddham
-            s = re.sub(r'([\U000116AD-\U000116B6])(\U000116B7)', r'\2\1', s)  # Takri
-            s = re.sub(r'([\U0001182C-\U00011839])(\U0001183A)', r'\2\1', s)  # Dogra
-            s = re.sub(r'([\U00011930-\U0001193E])(\U00011943)', r'\2\1', s)  # Dives Akuru
-            s = re.sub(r'([\U00011D31-\U00011D3F\U00011D45])(\U00011D42)', r'\2\1', s)  # Masaram Gondi
+        if lv & self.char_is_devanagari:
+            for nukta, nukta_re, replacement in devanagari_nukta_repairs:
+                if nukta in s:
+                    s = nukta_re.sub(replacement, s)
+        if lv & self.char_is_bengali_plus:
+            for nukta, nukta_re, replacement in bengali_plus_nukta_repairs:
+                if nukta in s:
+                    s = nukta_re.sub(replacement, s)
+        if lv & self.char_is_khmer_plus:
+            for nukta, nukta_re, replacement in khmer_plus_nukta_repairs:
+                if nukta in s:
+                    s = nukta_re.sub(replacement, s)
+        if lv & self.char_is_100_plus_block_of_interest:
+            for nukta, nukta_re, replacement in block_100_plus_nukta_repairs:
+                if nukta in s:
+                    s = nukta_re.sub(replacement, s)
         return s
 
     # noinspection SpellCheckingInspection
@@ -947,6 +1156,8 @@ class Wildebeest:
 
     @staticmethod
     def normalize_greek_punctuation(s: str) -> str:
+        if s.isascii():  # nothing to do for ASCII strings
+            return s
         s = s.replace('\u0340', '\u0300')   # U+0340 combining grave tone mark -> combining grave accent
         s = s.replace('\u0341', '\u0301')   # U+0341 combining acute tone mark -> combining acute accent
         s = s.replace('\u0343', '\u0313')   # U+0342 combining Greek koronis -> combining comma above
@@ -987,44 +1198,19 @@ class Wildebeest:
 
     def normalize_punctuation(self, s: str) -> str:
         # Excludes cases in normalize_dashes.
-        # punctuation
-        s = s.replace('\u00AB', '\u201C')  # U+201E left double-angle quotation mark -> left double quotation mark
-        s = s.replace('\u00BB', '\u201D')  # U+201F right double-angle quotation mark -> right double quotation mark
-        s = s.replace('\u201A', '\u2018')  # U+201A single low-9 quotation mark -> left single quotation mark
-        s = s.replace('\u201B', '\u2018')  # U+201B single high-reversed-9 quotation mark -> left single quotation mark
-        s = s.replace('\u201E', '\u201C')  # U+201E double low-9 quotation mark -> left double quotation mark
-        s = s.replace('\u201F', '\u201C')  # U+201F double high-reversed-9 quotation mark -> left double quotation mark
-        s = s.replace('\u2039', '\u2018')  # U+2039 left single-angle quotation mark -> left single quotation mark
-        s = s.replace('\u203A', '\u2019')  # U+203A right single-angle quotation mark -> right single quotation mark
-        s = re.sub(r'[\u2011\u2024-\u2026\u2033-\u203C\u2047-\u2057]', self.apply_mapping_dict, s)  # e.g. …
-        s = re.sub(r'[\u2329-\u232A\u2A74-\u2A76]',  self.apply_mapping_dict, s)                    # e.g. 〈〉
-        # math symbols
-        s = s.replace('\u2212', '-')       # U+2212 minus sign
-        s = s.replace('\u2215', '/')       # U+2215 division slash
-        s = s.replace('\u2216', '\\')      # U+2216 set minus
-        s = s.replace('\u2217', '*')       # U+2217 asterisk operator
-        s = s.replace('\u2218', '\u25E6')  # U+2218 ring operator -> white bullet
-        s = s.replace('\u2219', '\u2022')  # U+2219 bullet operator -> bullet
-        s = s.replace('\u2223', '|')       # U+2223 divides
-        s = s.replace('\u2236', ':')       # U+2236 ratio
-        s = s.replace('\u2254', ':=')      # U+2254 colon equals
-        s = s.replace('\u2255', '=:')      # U+2255 equals colon
-        s = s.replace('\u22C5', '\u00B7')  # U+22C5 dot operator -> middle dot
-        s = re.sub(r'[\u222C-\u2230\u2A0C]', self.apply_mapping_dict, s)  # e.g. ∭
+        s = punctuation_re.sub(lambda m: punctuation_dict[m.group()], s)
+        s = mappable_punctuation_re.sub(self.mapping_dict_repl, s)  # e.g. …
+        s = mappable_angle_bracket_re.sub(self.mapping_dict_repl, s)  # e.g. 〈〉
+        s = mappable_math_symbol_re.sub(self.mapping_dict_repl, s)  # e.g. ∭
         # integer plus period or comma ⒛ 🄆
-        s = re.sub(r'[\u2488-\u249B\U0001F100-\U0001F10A]', self.apply_mapping_dict, s)
+        s = number_with_period_or_comma_re.sub(self.mapping_dict_repl, s)
         return s
 
     @staticmethod
     def normalize_dash_punctuation(s: str) -> str:
-        # hyphen, non-breaking hyphen, figure dash, en dash, em dash, horizontal bar
-        s = re.sub(r'[\u2010-\u2015]', '-', s)
-        s = s.replace('\u2212', '-')  # U+2212 minus sign
-        s = s.replace('\u2500', '-')  # U+2500 box drawings light horizontal
-        s = s.replace('\u2501', '-')  # U+2501 box drawings heavy horizontal,
-        s = s.replace('\u2E3A', '-')  # U+2E3A two-em dash
-        s = s.replace('\u2E3B', '-')  # U+2E3B three-em dash
-        return s
+        if s.isascii():  # nothing to do for ASCII strings
+            return s
+        return dash_re.sub('-', s)
 
     @staticmethod
     def normalize_non_zero_spaces(s: str) -> str:
@@ -1035,29 +1221,25 @@ class Wildebeest:
         to regular SPACE.
         **Not** included: tab (= horizontal tabulation/character tabulation)
         """
-        s = s.replace('\u00A0', ' ')  # NO-BREAK SPACE
-        s = re.sub(r'[\u2000-\u200A]', ' ', s)
-        s = s.replace('\u202F', ' ')  # NARROW NO-BREAK SPACE
-        s = s.replace('\u205F', ' ')  # MEDIUM MATHEMATICAL SPACE
-        s = s.replace('\u3000', ' ')  # IDEOGRAPHIC SPACE
-        return s
+        if s.isascii():  # nothing to do for ASCII strings
+            return s
+        return non_zero_space_re.sub(' ', s)
 
     # noinspection SpellCheckingInspection
     def normalize_half_and_full_width_characters(self, s: str) -> str:
         """Replace fullwidth and halfwidth characters such as Ａ with regular Latin letters such as A."""
-        if re.search(r'[\uFF01-\uFFEE]', s):
-            s = re.sub(r'[\uFF01-\uFFEE]', self.apply_mapping_dict, s)
+        if half_and_full_width_re.search(s):
+            s = half_and_full_width_re.sub(self.mapping_dict_repl, s)
         return s
 
     def normalize_font_characters(self, s: str) -> str:
         # Replace font-variation characters such as ℂℹ𝒜 to CiA.
-        s = re.sub(r'[\u2102-\u2149\uFB20-\uFB29\U0001D400-\U0001D7FF\U0001EE00-\U0001EEBB\U0001FBF0-\U0001FBF9]',
-                   self.apply_mapping_dict, s)
+        s = font_re.sub(self.mapping_dict_repl, s)
         return s
 
     def normalize_small_characters(self, s: str) -> str:
         """Replace small version of characters with normal version, such as small ampersand ﹠ to regular &"""
-        s = re.sub(r'[\uFE50-\uFE6F]', self.apply_mapping_dict, s)
+        s = small_form_re.sub(self.mapping_dict_repl, s)
         return s
 
     def normalize_vertical_characters(self, s: str) -> str:
@@ -1065,25 +1247,24 @@ class Wildebeest:
         Replace vertical version of punctuation characters with normal horizontal version,
         such as vertical em-dash ︱ to horizontal em-dash —
         """
-        s = re.sub(r'[\u309F\u30FF\uFE10-\uFE19\uFE30-\uFE48]', self.apply_mapping_dict, s)
+        s = vertical_form_re.sub(self.mapping_dict_repl, s)
         return s
 
     def normalize_enclosure_characters(self, s: str) -> str:
         """
         Decompose enclosed (circled, squared, parenthesized) characters, e.g. 🄐 to (A).
         """
-        s = re.sub(r'[\u2460-\u2488\u249C-\u2500\u3036\u3200-\u3250\u3251-\u32C0\u32D0-\u32FF]',
-                   self.apply_mapping_dict, s)
-        s = re.sub(r'[\U0001F110-\U0001F16A\U0001F201-\U0001F260]', self.apply_mapping_dict, s)
+        s = enclosure_re.sub(self.mapping_dict_repl, s)
+        s = enclosure_supplement_re.sub(self.mapping_dict_repl, s)
         return s
 
     def normalize_core_compat_characters(self, s: str) -> str:
         # Replace Roman numeral characters to ASCII.
-        s = re.sub(r'[\u2160-\u217F]', self.apply_mapping_dict, s)
+        s = roman_numeral_re.sub(self.mapping_dict_repl, s)
         # Replace Hangul Compatibility characters with Unicode standard Hangul versions, e.g. ㄱ to ᄀ.
-        s = re.sub(r'[\u3131-\u318E]', self.apply_mapping_dict, s)
+        s = hangul_compatibility_re.sub(self.mapping_dict_repl, s)
         # Thai, Lao
-        s = re.sub(r'[\u0E33\u0EB3\u0EDC\u0EDD]', self.apply_mapping_dict, s)
+        s = thai_lao_compatibility_re.sub(self.mapping_dict_repl, s)
         return s
 
     # noinspection SpellCheckingInspection
@@ -1098,108 +1279,53 @@ class Wildebeest:
             Ethiopic languages (፱፻ = 900),
         as the characters of those numbers do not match one-to-one onto ASCII digits.
         """
-        if self.lv & self.char_is_arabic:
-            s = re.sub(r'[\u0660-\u0669]', self.apply_mapping_dict, s)  # ARABIC-INDIC digits
-            s = re.sub(r'[\u06F0-\u06F9]', self.apply_mapping_dict, s)  # EXTENDED ARABIC-INDIC digits
-        if self.lv & self.char_is_thaana_plus:
-            s = re.sub(r'[\u07C0-\u07C9]', self.apply_mapping_dict, s)  # NKO digits
-        if self.lv & self.char_is_devanagari:
-            s = re.sub(r'[\u0966-\u096F]', self.apply_mapping_dict, s)  # DEVANAGARI digits
-        if self.lv & self.char_is_bengali_plus:
-            s = re.sub(r'[\u09E6-\u09EF]', self.apply_mapping_dict, s)  # BENGALI digits
-            s = re.sub(r'[\u0A66-\u0A6F]', self.apply_mapping_dict, s)  # GURMUKHI digits
-            s = re.sub(r'[\u0AE6-\u0AEF]', self.apply_mapping_dict, s)  # GUJARATI digits
-            s = re.sub(r'[\u0B66-\u0B6F]', self.apply_mapping_dict, s)  # ORIYA digits
-            s = re.sub(r'[\u0BE6-\u0BEF]', self.apply_mapping_dict, s)  # TAMIL digits
-            s = re.sub(r'[\u0C66-\u0C6F]', self.apply_mapping_dict, s)  # TELUGU digits
-            s = re.sub(r'[\u0CE6-\u0CEF]', self.apply_mapping_dict, s)  # KANNADA digits
-            s = re.sub(r'[\u0D66-\u0D6F]', self.apply_mapping_dict, s)  # MALAYALAM digits
-            s = re.sub(r'[\u0DE6-\u0DEF]', self.apply_mapping_dict, s)  # SINHALA LITH digits
-        if self.lv & self.char_is_thai_plus:
-            s = re.sub(r'[\u0E50-\u0E59]', self.apply_mapping_dict, s)  # THAI digits
-            s = re.sub(r'[\u0ED0-\u0ED9]', self.apply_mapping_dict, s)  # LAO digits
-            s = re.sub(r'[\u0F20-\u0F29]', self.apply_mapping_dict, s)  # TIBETAN digits
-            s = re.sub(r'[\u1040-\u1049]', self.apply_mapping_dict, s)  # MYANMAR digits
-            s = re.sub(r'[\u1090-\u1099]', self.apply_mapping_dict, s)  # MYANMAR SHAN digits
-        if self.lv & self.char_is_khmer_plus:
-            s = re.sub(r'[\u17E0-\u17E9]', self.apply_mapping_dict, s)  # KHMER digits
-            s = re.sub(r'[\u1810-\u1819]', self.apply_mapping_dict, s)  # MONGOLIAN digits
-            s = re.sub(r'[\u1946-\u194F]', self.apply_mapping_dict, s)  # LIMBU digits
-            s = re.sub(r'[\u19D0-\u19DA]', self.apply_mapping_dict, s)  # NEW TAI LUE digits
-            s = re.sub(r'[\u1A80-\u1A89]', self.apply_mapping_dict, s)  # TAI THAM HORA digits
-            s = re.sub(r'[\u1A90-\u1A99]', self.apply_mapping_dict, s)  # TAI THAM THAM digits
-            s = re.sub(r'[\u1B50-\u1B59]', self.apply_mapping_dict, s)  # BALINESE digits
-            s = re.sub(r'[\u1BB0-\u1BB9]', self.apply_mapping_dict, s)  # SUNDANESE digits
-            s = re.sub(r'[\u1C40-\u1C49]', self.apply_mapping_dict, s)  # LEPCHA digits
-            s = re.sub(r'[\u1C50-\u1C59]', self.apply_mapping_dict, s)  # OL CHIKI digits
-        if self.lv & self.char_is_lisu_plus:
-            s = re.sub(r'[\uA620-\uA629]', self.apply_mapping_dict, s)  # VAI digits
-            s = re.sub(r'[\uA8D0-\uA8D9]', self.apply_mapping_dict, s)  # SAURASHTRA digits
-            s = re.sub(r'[\uA900-\uA909]', self.apply_mapping_dict, s)  # KAYAH LI digits
-            s = re.sub(r'[\uA9D0-\uA9D9]', self.apply_mapping_dict, s)  # JAVANESE digits
-            s = re.sub(r'[\uA9F0-\uA9F9]', self.apply_mapping_dict, s)  # MYANMAR TAI LAING digits
-            s = re.sub(r'[\uAA50-\uAA59]', self.apply_mapping_dict, s)  # CHAM digits
-            s = re.sub(r'[\uABF0-\uABF9]', self.apply_mapping_dict, s)  # MEETEI MAYEK digits
-        if self.lv & self.char_is_100_plus_block_of_interest:
-            s = re.sub(r'[\U000104A0-\U000104A9]', self.apply_mapping_dict, s)  # OSMANYA digits
-            s = re.sub(r'[\U00010D30-\U00010D39]', self.apply_mapping_dict, s)  # HANIFI ROHINGYA digits
-            s = re.sub(r'[\U00011066-\U0001106F]', self.apply_mapping_dict, s)  # BRAHMI digits
-            s = re.sub(r'[\U000110F0-\U000110F9]', self.apply_mapping_dict, s)  # SORA SOMPENG digits
-            s = re.sub(r'[\U00011136-\U0001113F]', self.apply_mapping_dict, s)  # CHAKMA digits
-            s = re.sub(r'[\U000111D0-\U000111D9]', self.apply_mapping_dict, s)  # SHARADA digits
-            s = re.sub(r'[\U000112F0-\U000112F9]', self.apply_mapping_dict, s)  # KHUDAWADI digits
-            s = re.sub(r'[\U00011450-\U00011459]', self.apply_mapping_dict, s)  # NEWA digits
-            s = re.sub(r'[\U000114D0-\U000114D9]', self.apply_mapping_dict, s)  # TIRHUTA digits
-            s = re.sub(r'[\U00011650-\U00011659]', self.apply_mapping_dict, s)  # MODI digits
-            s = re.sub(r'[\U000116C0-\U000116C9]', self.apply_mapping_dict, s)  # TAKRI digits
-            s = re.sub(r'[\U00011730-\U00011739]', self.apply_mapping_dict, s)  # AHOM digits
-            s = re.sub(r'[\U000118E0-\U000118E9]', self.apply_mapping_dict, s)  # WARANG CITI digits
-            s = re.sub(r'[\U00011C50-\U00011C59]', self.apply_mapping_dict, s)  # BHAIKSUKI digits
-            s = re.sub(r'[\U00011D50-\U00011D59]', self.apply_mapping_dict, s)  # MASARAM GONDI digits
-            s = re.sub(r'[\U00011DA0-\U00011DA9]', self.apply_mapping_dict, s)  # GUNJALA GONDI digits
-            s = re.sub(r'[\U00016A60-\U00016A69]', self.apply_mapping_dict, s)  # MRO digits
-            s = re.sub(r'[\U00016B50-\U00016B59]', self.apply_mapping_dict, s)  # PAHAWH HMONG digits
-            s = re.sub(r'[\U0001E950-\U0001E959]', self.apply_mapping_dict, s)  # ADLAM digits
+        lv = self.lv
+        if lv & self.char_is_arabic:
+            s = arabic_digit_re.sub(self.mapping_dict_repl, s)
+        if lv & self.char_is_thaana_plus:
+            s = thaana_plus_digit_re.sub(self.mapping_dict_repl, s)
+        if lv & self.char_is_devanagari:
+            s = devanagari_digit_re.sub(self.mapping_dict_repl, s)
+        if lv & self.char_is_bengali_plus:
+            s = bengali_plus_digit_re.sub(self.mapping_dict_repl, s)
+        if lv & self.char_is_thai_plus:
+            s = thai_plus_digit_re.sub(self.mapping_dict_repl, s)
+        if lv & self.char_is_khmer_plus:
+            s = khmer_plus_digit_re.sub(self.mapping_dict_repl, s)
+        if lv & self.char_is_lisu_plus:
+            s = lisu_plus_digit_re.sub(self.mapping_dict_repl, s)
+        if lv & self.char_is_100_plus_block_of_interest:
+            s = block_100_plus_digit_re.sub(self.mapping_dict_repl, s)
         return s
 
     # noinspection SpellCheckingInspection
     @staticmethod
     def repair_xml(s: str) -> str:
         # Repair multi-level xml-escapes such as &amp;amp;quot; to &quot;
-        s = re.sub(r'(?<=&)(?:amp;)+(?=(?:amp|apos|gt|lt|nbsp|quot|#\d{1,6}|#x[0-9A-F]{1,5});)',
-                   '', s, flags=re.IGNORECASE)
+        s = multi_level_xml_escape_re.sub('', s)
         return s
 
     # noinspection SpellCheckingInspection
     @staticmethod
     def repair_url_escapes(s: str) -> str:
         # Repair double url-escapes such as https://en.wikipedia.org/wiki/Jo%25C3%25ABlle_Aubron
-        s = re.sub(r"(%)25([CD][0-9A-F]%)25([89AB][0-9A-F])", r"\1\2\3", s)
-        s = re.sub(r'(%)25(E[0-9A-F]%)25([89AB][0-9A-F]%)25([89AB][0-9A-F])', r"\1\2\3\4", s)
+        s = double_url_escape_2_byte_re.sub(r"\1\2\3", s)
+        s = double_url_escape_3_byte_re.sub(r"\1\2\3\4", s)
         return s
 
     def repair_arabic_tokenization(self, s: str) -> str:
         """Detach certain punctuation -_+*|% and ASCII digits from Arabic characters."""
         # s = re.sub(r"([-_+*|%0-9]+)([\u0600-\u06FF])", r"\1 \2", s)
         # s = re.sub(r"([\u0600-\u06FF])([-_+*|%0-9]+)", r"\1 \2", s)
-        s = self.repair_tok_punct_arabic_match.sub(r"\1 \2", s)
-        s = self.repair_tok_arabic_punct_match.sub(r"\1 \2", s)
-        return s
+        return self.repair_tok_arabic_boundary_match.sub(" ", s)
 
     def char_script(self, char: str) -> Optional[str]:
-        char_type_vector = self.char_type_vector_dict.get(char, 0)
-        if char_type_vector & self.char_is_latin:
-            return 'Latin'
-        elif char_type_vector & self.char_is_greek:
-            return 'Greek'
-        elif char_type_vector & self.char_is_cyrillic:
-            return 'Cyrillic'
-        else:
-            return None
+        """Returns 'Latin', 'Greek', 'Cyrillic' or None."""
+        return self.char_script_dict.get(char)
 
     def tokenize_mixed_script_tokens(self, orig_token: str) -> str:
         """insert space (effectively split) token with mixed scripts at certain script transition points"""
-        token = ''
+        token_chars = []
         script = None
         script_start = 0
         orig_token_len = len(orig_token)
@@ -1216,256 +1342,444 @@ class Wildebeest:
                             and script in self.look_alike_scripts
                             and new_script in self.look_alike_scripts)\
                             and new_script == self.char_script(orig_token[position+1]):
-                        token += ' '
+                        token_chars.append(' ')
                     script = new_script
                     script_start = position
                 last_char_is_punctuation = False
-            token += char
-        return token
+            token_chars.append(char)
+        return ''.join(token_chars)
 
     @staticmethod
     def is_mixed_script_url(s: str) -> bool:
-        return bool(re.match(r'(?:https?://)?[a-zA-Z][-_./0-9a-zA-Z]*\.(?:bg|by|me|mk|kg|kz|rs|ru|tj|tm|ua|uz|'
-                             r'com|info)/[-_./#0-9\u0400-\u04FF]+$', s, flags=re.IGNORECASE)
-                    or re.match(r'(?:https?://)?[\u0400-\u04FF][-_./0-9\u0400-\u04FF]*'
-                                r'\.(bg|by|me|mk|kg|kz|rs|ru|tj|tm|ua|uz|com|info)$', s))
+        return bool(mixed_script_url_re.match(s))
 
     def map_look_alikes_to_script(self, s: str, source_script: str, target_script: str) -> str:
-        result = ''
-        for char in s:
-            result += self.look_alike_dict.get(f'{source_script} {target_script} {char}', char)
-        return result
+        look_alike_map = self.look_alike_script_pair_dict[(source_script, target_script)]
+        return ''.join([look_alike_map.get(char, char) for char in s])
 
     def correct_look_alikes(self, s: str) -> str:
         # orig_s = s
-        result = ''
-        while True:
-            m = re.match(r'(\s*)(\S+)(.*)$', s)
-            if m:
-                result += m.group(1)
-                orig_token = m.group(2)
-                stat_dict = {}
-                for char in orig_token:
-                    script = self.char_script(char)
-                    if script:
-                        stat_dict[script] = stat_dict.get(script, 0) + 1
-                        for target_script in self.look_alike_scripts:
-                            if script != target_script:
-                                target_char = self.look_alike_dict.get(f'{script} {target_script} {char}', None)
-                                if target_char:
-                                    key = f'{script} {target_script}'
-                                    stat_dict[key] = stat_dict.get(key, 0) + 1
-                target_script = None
-                mixed_token = False
-                n_scripts = 0
-                for script in ['Latin', 'Greek', "Cyrillic"]:
-                    if stat_dict.get(script, 0) >= 1:
-                        n_scripts += 1
-                if n_scripts >= 2:
-                    mixed_token = True
-                    if (stat_dict.get('Cyrillic Latin', 0) == stat_dict.get('Cyrillic', 0)
-                            and stat_dict.get('Latin Cyrillic', 0) < stat_dict.get('Latin', 0)):
-                        target_script = 'Latin'
-                    elif (stat_dict.get('Latin Cyrillic', 0) == stat_dict.get('Latin', 0)
-                          and stat_dict.get('Cyrillic Latin', 0) < stat_dict.get('Cyrillic', 0)):
-                        target_script = 'Cyrillic'
-                    elif (stat_dict.get('Cyrillic', 0) == 1 and stat_dict.get('Cyrillic Latin', 0) == 1
-                          and stat_dict.get('Latin', 0) >= 3):
-                        target_script = 'Latin'
-                    elif (stat_dict.get('Latin', 0) == 1 and stat_dict.get('Latin Cyrillic', 0) == 1
-                          and stat_dict.get('Cyrillic', 0) >= 3):
-                        target_script = 'Cyrillic'
-                    else:
-                        lat_token = self.map_look_alikes_to_script(orig_token, 'Cyrillic', 'Latin')
-                        if (lat_token in ['SpA', 'USA']
-                            or (len(orig_token) >= 2
-                                and re.match(r'(?:X|XX|XXX|XL|L|LX|LXX|LXXX|XC|)(?:I|II|III|IV|V|VI|VII|VIII|IX|)$',
-                                             lat_token))):
-                            target_script = 'Latin'
-                        cyr_token = self.map_look_alikes_to_script(orig_token, 'Latin', 'Cyrillic')
-                        if cyr_token in ['әр', 'Әр', 'әрі', 'сі', 'Сі', 'іс', 'Іс', 'ісі', 'ірі']:
-                            target_script = 'Cyrillic'
-                if target_script:
-                    token = ''
-                    for char in orig_token:
-                        script = self.char_script(char)
-                        target_char = self.look_alike_dict.get(f'{script} {target_script} {char}', char)
-                        token += target_char
-                    key = 'n-to-' + target_script
-                    self.look_alike_dict[key] = self.look_alike_dict.get(key, 0) + 1
-                else:
-                    retok_orig_token = self.tokenize_mixed_script_tokens(orig_token)
-                    if retok_orig_token != orig_token:
-                        token = retok_orig_token
-                        key = 'n-split'
-                        if self.look_alike_split_dict.get(orig_token, None) is None:
-                            log.debug(f'   correct-look-alike split {orig_token} -> {token}')
-                            self.look_alike_split_dict[orig_token] = token
-                        self.look_alike_dict[key] = self.look_alike_dict.get(key, 0) + 1
-                    else:
-                        token = orig_token
-                        if mixed_token:
-                            key = 'n-unchanged'
-                            self.look_alike_dict[key] = self.look_alike_dict.get(key, 0) + 1
-                # if token != orig_token:
-                #     log.info(f'   correct-look-alike {orig_token} -> {token} (to {target_script})')
-                if mixed_token and token == orig_token:
-                    if self.is_mixed_script_url(orig_token):
-                        if self.look_alike_url_dict.get(orig_token, None) is None:
-                            log.debug(f'mixed-script-URL: {orig_token}')
-                            self.look_alike_url_dict[orig_token] = True
-                    else:
-                        self.look_alike_unchanged_dict[token] = self.look_alike_unchanged_dict.get(token, 0) + 1
-                result += token
-                s = m.group(3)
+        m = first_token_re.match(s)
+        if not m:
+            return s
+        # Like matching first_token_re token by token on the rest of the line, s[:m.end(3)] excludes a final
+        # linefeed. The tokens alternate with whitespace (or '' at the edges) in a single split.
+        result = whitespace_split_re.split(s[:m.end(3)])
+        for i in range(0, len(result), 2):
+            if result[i]:
+                result[i] = self.correct_look_alikes_in_token(result[i])
+        # log.info(f'  look-alike {orig_s} -> {result}')
+        return ''.join(result)
+
+    def correct_look_alikes_in_token(self, orig_token: str) -> str:
+        # Tokens with letters from at most one look-alike script are neither mapped nor split.
+        # (Most tokens of a line with multiple look-alike scripts are single-script tokens.)
+        if orig_token.isascii():  # ASCII letters are all Latin
+            return orig_token
+        char_type_vector_pages = self.char_type_vector_pages
+        token_lv = 0
+        for char in set(orig_token):
+            code_point = ord(char)
+            token_lv |= char_type_vector_pages[code_point >> 8][code_point & 0xFF]
+        look_alike_script_lv = token_lv & self.look_alike_script_mask
+        if not look_alike_script_lv & (look_alike_script_lv - 1):
+            return orig_token
+        if (analysis := self.look_alike_token_cache.get(orig_token)) is None:
+            analysis = self.analyze_look_alike_token(orig_token)
+            if len(self.look_alike_token_cache) < 100000:  # Cache result, but avoid clogging run-time memory space
+                self.look_alike_token_cache[orig_token] = analysis
+        token, key, mixed_token = analysis
+        if key:
+            self.look_alike_dict[key] = self.look_alike_dict.get(key, 0) + 1
+        if key == 'n-split' and self.look_alike_split_dict.get(orig_token, None) is None:
+            log.debug(f'   correct-look-alike split {orig_token} -> {token}')
+            self.look_alike_split_dict[orig_token] = token
+        # if token != orig_token:
+        #     log.info(f'   correct-look-alike {orig_token} -> {token}')
+        if mixed_token and token == orig_token:
+            if self.is_mixed_script_url(orig_token):
+                if self.look_alike_url_dict.get(orig_token, None) is None:
+                    log.debug(f'mixed-script-URL: {orig_token}')
+                    self.look_alike_url_dict[orig_token] = True
+            else:
+                self.look_alike_unchanged_dict[token] = self.look_alike_unchanged_dict.get(token, 0) + 1
+        return token
+
+    def analyze_look_alike_token(self, orig_token: str) -> Tuple[str, Optional[str], bool]:
+        """
+        Returns the look-alike corrected token, the key of its count in look_alike_dict (if any),
+        and whether the token mixes look-alike scripts. Depends only on orig_token (see look_alike_token_cache).
+        """
+        # Script of each character of the token, computed once.
+        char_scripts = [self.char_script(char) for char in orig_token]
+        stat_dict = {}
+        for char, script in zip(orig_token, char_scripts):
+            if script:
+                stat_dict[script] = stat_dict.get(script, 0) + 1
+                for target_script in self.look_alike_scripts:
+                    if script != target_script:
+                        target_char = self.look_alike_script_pair_dict[(script, target_script)].get(char)
+                        if target_char:
+                            key = f'{script} {target_script}'
+                            stat_dict[key] = stat_dict.get(key, 0) + 1
+        target_script = None
+        mixed_token = False
+        n_scripts = 0
+        for script in ['Latin', 'Greek', "Cyrillic"]:
+            if stat_dict.get(script, 0) >= 1:
+                n_scripts += 1
+        if n_scripts >= 2:
+            mixed_token = True
+            if (stat_dict.get('Cyrillic Latin', 0) == stat_dict.get('Cyrillic', 0)
+                    and stat_dict.get('Latin Cyrillic', 0) < stat_dict.get('Latin', 0)):
+                target_script = 'Latin'
+            elif (stat_dict.get('Latin Cyrillic', 0) == stat_dict.get('Latin', 0)
+                  and stat_dict.get('Cyrillic Latin', 0) < stat_dict.get('Cyrillic', 0)):
+                target_script = 'Cyrillic'
+            elif (stat_dict.get('Cyrillic', 0) == 1 and stat_dict.get('Cyrillic Latin', 0) == 1
+                  and stat_dict.get('Latin', 0) >= 3):
+                target_script = 'Latin'
+            elif (stat_dict.get('Latin', 0) == 1 and stat_dict.get('Latin Cyrillic', 0) == 1
+                  and stat_dict.get('Cyrillic', 0) >= 3):
+                target_script = 'Cyrillic'
+            else:
+                lat_token = self.map_look_alikes_to_script(orig_token, 'Cyrillic', 'Latin')
+                if (lat_token in ['SpA', 'USA']
+                    or (len(orig_token) >= 2
+                        and roman_numeral_token_re.match(lat_token))):
+                    target_script = 'Latin'
+                cyr_token = self.map_look_alikes_to_script(orig_token, 'Latin', 'Cyrillic')
+                if cyr_token in ['әр', 'Әр', 'әрі', 'сі', 'Сі', 'іс', 'Іс', 'ісі', 'ірі']:
+                    target_script = 'Cyrillic'
+        key = None
+        if target_script:
+            token_chars = []
+            for char, script in zip(orig_token, char_scripts):
+                target_char = self.look_alike_script_pair_dict.get((script, target_script), {}).get(char, char)
+                token_chars.append(target_char)
+            token = ''.join(token_chars)
+            key = 'n-to-' + target_script
+        else:
+            retok_orig_token = self.tokenize_mixed_script_tokens(orig_token)
+            if retok_orig_token != orig_token:
+                token = retok_orig_token
+                key = 'n-split'
             else:
-                result += s
-                # log.info(f'  look-alike {orig_s} -> {result}')
-                return result
+                token = orig_token
+                if mixed_token:
+                    key = 'n-unchanged'
+        return token, key, mixed_token
 
     @staticmethod
     def increment_dict_count(ht: dict, key: str, increment=1) -> int:
-        """For example ht['NUMBER-OF-LINES']"""
-        ht[key] = ht.get(key, 0) + increment
-        return ht[key]
+        """For example ht['NUMBER-OF-LINES']. ht is typically a defaultdict(int), but can also be a regular dict."""
+        try:
+            count = ht[key] + increment
+        except KeyError:
+            count = increment
+        ht[key] = count
+        return count
+
+    @staticmethod
+    def skip_steps_in_ht(ht: dict) -> frozenset:
+        """Set of normalization/cleaning groups that ht marks to be skipped, e.g. {'SKIP-digit': True} -> {'digit'}"""
+        return frozenset(key[5:] for key, value in ht.items() if key.startswith('SKIP-') and value)
 
     def ncs_group(self, s: str, ht: dict, group_name: str, group_function: Callable,
-                  loc_id: str) -> str:
+                  loc_id: Union[int, str]) -> str:
         """
         ncs_group: normalize and clean string group.
         For a given normalization/cleaning group, call appropriate function and update stats.
+        loc_id (e.g. a line number) is converted to a string only when it is recorded.
         """
-        skip_key = f'SKIP-{group_name}'
+        # The SKIP-, CALL- and COUNT- keys of a group are built once, rather than per call.
+        if (stat_keys := self.ncs_group_stat_keys.get(group_name)) is None:
+            stat_keys = (f'SKIP-{group_name}', f'CALL-{group_name}', f'COUNT-{group_name}')
+            self.ncs_group_stat_keys[group_name] = stat_keys
+        skip_key, call_key, count_key = stat_keys
         if not ht.get(skip_key, False):
-            self.increment_dict_count(ht, f'CALL-{group_name}')  # keep track of how often norm-group is called
+            self.increment_dict_count(ht, call_key)  # keep track of how often norm-group is called
             orig_s = s
             s = group_function(s)
             if s != orig_s:
-                count_key = f'COUNT-{group_name}'
                 count = self.increment_dict_count(ht, count_key)
                 if loc_id and (count <= 20):
                     loc_key = f'{count_key}-{count}'
-                    ht[loc_key] = loc_id
+                    ht[loc_key] = str(loc_id)
         return s
 
     def set_lv(self, s: str) -> None:
-        self.lv = 0  # line_char_type_vector
+        lv = 0  # line_char_type_vector
         # Each bit in this vector is to capture character type info, e.g. char_is_arabic
-        for char in s:
-            char_type_vector = self.char_type_vector_dict.get(char, 0)
+        if s.isascii():
+            # ASCII fast path: test the line's characters against each group of ASCII characters with the same
+            # character type vector (set operations in C) rather than looking up characters one by one.
+            chars = set(s)
+            for group_chars, char_type_vector in self.ascii_char_type_groups:
+                if not group_chars.isdisjoint(chars):
+                    lv |= char_type_vector
+            self.lv = lv
+            return
+        char_type_vector_pages = self.char_type_vector_pages
+        # Characters typically recur within a line, so look up each distinct character only once.
+        for char in set(s):
+            code_point = ord(char)
+            char_type_vector = char_type_vector_pages[code_point >> 8][code_point & 0xFF]
             if char_type_vector:
                 # A set bit in the lv means that the bit has been set by at least one char.
                 # So we will easily know whether e.g. a line contains an Arabic character.
                 # If not, some Arabic-specific normalization steps can be skipped to improve run-time.
-                self.lv = self.lv | char_type_vector
+                lv |= char_type_vector
+        self.lv = lv
+
+    def char_type_groups(self, chars: Iterable[str]) -> List[Tuple[frozenset, int]]:
+        """Groups chars with a non-zero character type vector by that vector; returns (chars, vector) pairs."""
+        chars_by_char_type_vector = defaultdict(set)
+        for char in chars:
+            if char_type_vector := self.char_type_vector_dict.get(char, 0):
+                chars_by_char_type_vector[char_type_vector].add(char)
+        return [(frozenset(group_chars), char_type_vector)
+                for char_type_vector, group_chars in chars_by_char_type_vector.items()]
+
+    @staticmethod
+    def norm_step_lang_variant(lang_code: str) -> str:
+        """Language codes with their own normalization steps (Persian, Pashto); any other language code maps to ''."""
+        return lang_code if lang_code in ('fas', 'pas') else ''
+
+    def norm_step_dispatch_table(self, lang_code: str = '', skip_steps: frozenset = frozenset()) -> List[tuple]:
+        """
+        List of (mask1, mask2, group_name, group_function) tuples, in order of application.
+        norm_clean_string applies a normalization/cleaning group to a line if the line's character type vector (lv)
+        shares at least one bit with mask1 and at least one bit with mask2. Groups listed in skip_steps are left out.
+        Built once per language-specific variant and set of skipped steps.
+        """
+        lang_code = self.norm_step_lang_variant(lang_code)
+        if table := self.norm_step_dispatch_tables.get((lang_code, skip_steps)):
+            return table
+        if lang_code == 'fas':
+            lang_char_step = (self.char_is_mappable_in_farsi | self.char_is_arabic_presentation_form,
+                              'farsi-char', self.normalize_farsi_characters)
+        elif lang_code == 'pas':
+            lang_char_step = (self.char_is_mappable_in_pashto | self.char_is_arabic_presentation_form,
+                              'pashto-char', self.normalize_pashto_characters)
+        else:
+            lang_char_step = (self.char_is_mappable_in_arabic | self.char_is_arabic_presentation_form,
+                              'arabic-char', self.normalize_arabic_characters)
+        # mask2 None means that mask1 is the only condition.
+        table = [(mask1, mask2 or mask1, group_name, group_function) for mask1, mask2, group_name, group_function in [
+            (self.char_is_encoding_repair_anchor, None, 'repair-encoding-errors', self.repair_encoding_errors),
+            # Cleaning step 'del-surrogate' is an alternative/backup to windows-1252.
+            # It should not be skipped because surrogates are not printable.
+            (self.char_is_surrogate, None, 'del-surrogate', self.delete_surrogates),
+            (self.char_is_deletable_control_character, None, 'del-ctrl-char', self.delete_control_characters),
+            (self.char_is_zero_width_character, None, 'del-zero-width', self.delete_zero_width_characters),
+            (self.char_is_arabic_tatweel, None, 'del-tatweel', self.delete_arabic_tatweel),
+            (self.char_is_deletable_arabic_diacritic, None, 'del-arabic-diacr', self.delete_arabic_diacritics),
+            (self.char_is_deletable_hebrew_diacritic, None, 'del-hebrew-diacr', self.delete_hebrew_diacritics),
+            (self.char_is_core_compatibility, None, 'core-compat', self.normalize_core_compat_characters),
+            (self.char_is_arabic_presentation_form, None, 'pres-form', self.normalize_arabic_pres_form_characters),
+            (self.char_is_decomposable_ligature, None, 'ligatures', self.normalize_ligatures),
+            (self.char_is_decomposable_sign_symbol, None, 'signs-and-symbols', self.normalize_signs_and_symbols),
+            (self.char_is_decomposable_cjk, None, 'cjk', self.normalize_cjk),
+            (self.char_is_fullwidth_or_halfwidth, None, 'width', self.normalize_half_and_full_width_characters),
+            (self.char_is_font_small_vertical, None, 'font', self.normalize_font_characters),
+            (self.char_is_font_small_vertical, None, 'small', self.normalize_small_characters),
+            (self.char_is_font_small_vertical, None, 'vertical', self.normalize_vertical_characters),
+            (self.char_is_decomposable_enclosure, None, 'enclosure', self.normalize_enclosure_characters),
+            (self.char_is_mappable_hangul, None, 'hangul', self.normalize_hangul),
+            (self.char_is_nukta, None, 'repair-combining', self.repair_combining_modifiers_with_nukta),
+            (self.char_is_composable_anchor_with_combining, self.char_is_composable_combining_diacritic,
+             'combining-compose', self.apply_combining_modifiers_compose),
+            (self.char_is_decomposable_with_combining, None, 'combining-decompose',
+             self.apply_combining_modifiers_decompose),
+            (self.char_is_core_compatibility, None, 'punct', self.normalize_punctuation),
+            (self.char_is_decomposable_arabic_punctuation, None, 'punct-arabic', self.normalize_arabic_punctuation),
+            (self.char_is_decomposable_cjk_punctuation, None, 'punct-cjk', self.normalize_cjk_punctuation),
+            (self.char_is_decomposable_greek_punctuation, None, 'punct-greek', self.normalize_greek_punctuation),
+            (self.char_is_decomposable_misc_f_punctuation, None, 'punct-misc-f', self.normalize_misc_f_punctuation),
+            (self.char_is_decomposable_dash, None, 'punct-dash', self.normalize_dash_punctuation),
+            (self.char_is_decomposable_non_zero_space, None, 'space', self.normalize_non_zero_spaces),
+            (self.char_is_mappable_decimal_digit, None, 'digit', self.map_digits_to_ascii),
+            (self.char_is_arabic, *lang_char_step),
+            (self.char_is_georgian, None, 'georgian-char', self.normalize_georgian_characters),
+            (self.line_has_multiple_look_alike_scripts, None, 'look-alike', self.correct_look_alikes),
+            (self.char_is_ampersand, self.char_is_semicolon, 'repair-xml', self.repair_xml),
+            (self.char_is_percent_sign, None, 'repair-url-espaces', self.repair_url_escapes),
+            (self.char_is_arabic, self.char_is_detachable_from_token | self.char_is_mappable_decimal_digit,
+             'repair-token', self.repair_arabic_tokenization)]
+            if group_name not in skip_steps]
+        self.norm_step_dispatch_tables[(lang_code, skip_steps)] = table
+        return table
+
+    def applicable_norm_steps(self, lv: int, lang_code: str = '', skip_steps: frozenset = frozenset()) -> List[tuple]:
+        """List of (group_name, group_function) pairs of the dispatch table that apply to a line vector lv."""
+        key = (lv, lang_code, skip_steps)
+        if (result := self.applicable_norm_steps_cache.get(key)) is not None:
+            return result
+        result = [(group_name, group_function)
+                  for mask1, mask2, group_name, group_function in self.norm_step_dispatch_table(lang_code, skip_steps)
+                  if (lv & mask1) and (lv & mask2)]
+        # Cache result, but avoid clogging run-time memory space
+        if len(self.applicable_norm_steps_cache) < 100000:
+            self.applicable_norm_steps_cache[key] = result
+        return result
+
+    def norm_step_lv(self, s: str) -> int:
+        """Sets self.lv for s and returns it, plus line-level bits, for the selection of normalization steps."""
+        self.set_lv(s)
+        lv = self.lv
+        # At least two look-alike script bits set, i.e. still non-zero after clearing the lowest set bit.
+        look_alike_script_lv = lv & self.look_alike_script_mask
+        if look_alike_script_lv & (look_alike_script_lv - 1):
+            lv |= self.line_has_multiple_look_alike_scripts
+        return lv
 
     # noinspection SpellCheckingInspection,SpellCheckingInspection
-    def norm_clean_string(self, s: str, ht: dict, lang_code: str = '', loc_id: str = '') -> str:
+    def norm_clean_string(self, s: str, ht: dict, lang_code: str = '', loc_id: Union[int, str] = '',
+                          skip_steps: frozenset = frozenset()) -> str:
         # log.info(f'ht: {ht}')
-        """Go through a list of applicable normalization/cleaning steps and keep track of the number of changes."""
+        """
+        Go through a list of applicable normalization/cleaning steps and keep track of the number of changes.
+        Optional skip_steps (see skip_steps_in_ht) removes skipped steps from the dispatch table up front;
+        any SKIP- entries in ht are honored either way.
+        """
         number_of_lines = ht.get('NUMBER-OF-LINES', 0) + 1
         ht['NUMBER-OF-LINES'] = number_of_lines
         orig_s = s
-        self.set_lv(s)
-        if self.lv & self.char_is_encoding_repair_anchor:
-            s = self.ncs_group(s, ht, 'repair-encoding-errors', self.repair_encoding_errors, loc_id)
-        # Cleaning step 'del-surrogate' is an alternative/backup to windows-1252.
-        # It should not be skipped because surrogates are not printable.
-        if self.lv & self.char_is_surrogate:
-            s = self.ncs_group(s, ht, 'del-surrogate', self.delete_surrogates, loc_id)
-        if self.lv & self.char_is_deletable_control_character:
-            s = self.ncs_group(s, ht, 'del-ctrl-char', self.delete_control_characters, loc_id)
-        if self.lv & self.char_is_zero_width_character:
-            s = self.ncs_group(s, ht, 'del-zero-width', self.delete_zero_width_characters, loc_id)
-        if self.lv & self.char_is_arabic_tatweel:
-            s = self.ncs_group(s, ht, 'del-tatweel', self.delete_arabic_tatweel, loc_id)
-        if self.lv & self.char_is_deletable_arabic_diacritic:
-            s = self.ncs_group(s, ht, 'del-arabic-diacr', self.delete_arabic_diacritics, loc_id)
-        if self.lv & self.char_is_deletable_hebrew_diacritic:
-            s = self.ncs_group(s, ht, 'del-hebrew-diacr', self.delete_hebrew_diacritics, loc_id)
-        if self.lv & self.char_is_core_compatibility:
-            s = self.ncs_group(s, ht, 'core-compat', self.normalize_core_compat_characters, loc_id)
-        if self.lv & self.char_is_arabic_presentation_form:
-            s = self.ncs_group(s, ht, 'pres-form', self.normalize_arabic_pres_form_characters, loc_id)
-        if self.lv & self.char_is_decomposable_ligature:
-            s = self.ncs_group(s, ht, 'ligatures', self.normalize_ligatures, loc_id)
-        if self.lv & self.char_is_decomposable_sign_symbol:
-            s = self.ncs_group(s, ht, 'signs-and-symbols', self.normalize_signs_and_symbols, loc_id)
-        if self.lv & self.char_is_decomposable_cjk:
-            s = self.ncs_group(s, ht, 'cjk', self.normalize_cjk, loc_id)
-        if self.lv & self.char_is_fullwidth_or_halfwidth:
-            s = self.ncs_group(s, ht, 'width', self.normalize_half_and_full_width_characters, loc_id)
-        if self.lv & self.char_is_font_small_vertical:
-            s = self.ncs_group(s, ht, 'font', self.normalize_font_characters, loc_id)
-            s = self.ncs_group(s, ht, 'small', self.normalize_small_characters, loc_id)
-            s = self.ncs_group(s, ht, 'vertical', self.normalize_vertical_characters, loc_id)
-        if self.lv & self.char_is_decomposable_enclosure:
-            s = self.ncs_group(s, ht, 'enclosure', self.normalize_enclosure_characters, loc_id)
-        if self.lv & self.char_is_mappable_hangul:
-            s = self.ncs_group(s, ht, 'hangul', self.normalize_hangul, loc_id)
-        if self.lv & self.char_is_nukta:
-            s = self.ncs_group(s, ht, 'repair-combining', self.repair_combining_modifiers_with_nukta, loc_id)
-        if (self.lv & self.char_is_composable_anchor_with_combining) \
-                and (self.lv & self.char_is_composable_combining_diacritic):
-            s = self.ncs_group(s, ht, 'combining-compose', self.apply_combining_modifiers_compose, loc_id)
-        if self.lv & self.char_is_decomposable_with_combining:
-            s = self.ncs_group(s, ht, 'combining-decompose', self.apply_combining_modifiers_decompose, loc_id)
-        if self.lv & self.char_is_core_compatibility:
-            s = self.ncs_group(s, ht, 'punct', self.normalize_punctuation, loc_id)
-        if self.lv & self.char_is_decomposable_arabic_punctuation:
-            s = self.ncs_group(s, ht, 'punct-arabic', self.normalize_arabic_punctuation, loc_id)
-        if self.lv & self.char_is_decomposable_cjk_punctuation:
-            s = self.ncs_group(s, ht, 'punct-cjk', self.normalize_cjk_punctuation, loc_id)
-        if self.lv & self.char_is_decomposable_greek_punctuation:
-            s = self.ncs_group(s, ht, 'punct-greek', self.normalize_greek_punctuation, loc_id)
-        if self.lv & self.char_is_decomposable_misc_f_punctuation:
-            s = self.ncs_group(s, ht, 'punct-misc-f', self.normalize_misc_f_punctuation, loc_id)
-        if self.lv & self.char_is_decomposable_dash:
-            s = self.ncs_group(s, ht, 'punct-dash', self.normalize_dash_punctuation, loc_id)
-        if self.lv & self.char_is_decomposable_non_zero_space:
-            s = self.ncs_group(s, ht, 'space', self.normalize_non_zero_spaces, loc_id)
-        if self.lv & self.char_is_mappable_decimal_digit:
-            s = self.ncs_group(s, ht, 'digit', self.map_digits_to_ascii, loc_id)
-        if self.lv & self.char_is_arabic:
-            if lang_code == 'fas':
-                if (self.lv & self.char_is_mappable_in_farsi) or (self.lv & self.char_is_arabic_presentation_form):
-                    s = self.ncs_group(s, ht, 'farsi-char', self.normalize_farsi_characters, loc_id)
-            elif lang_code == 'pas':
-                if (self.lv & self.char_is_mappable_in_pashto) or (self.lv & self.char_is_arabic_presentation_form):
-                    s = self.ncs_group(s, ht, 'pashto-char', self.normalize_pashto_characters, loc_id)
-            else:
-                if (self.lv & self.char_is_mappable_in_arabic) or (self.lv & self.char_is_arabic_presentation_form):
-                    s = self.ncs_group(s, ht, 'arabic-char', self.normalize_arabic_characters, loc_id)
-        if self.lv & self.char_is_georgian:
-            s = self.ncs_group(s, ht, 'georgian-char', self.normalize_georgian_characters, loc_id)
-        n_scripts = 0
-        for script_lv in [self.char_is_latin, self.char_is_greek, self.char_is_cyrillic]:
-            if self.lv & script_lv:
-                n_scripts += 1
-        if n_scripts >= 2:
-            s = self.ncs_group(s, ht, 'look-alike', self.correct_look_alikes, loc_id)
-        if (self.lv & self.char_is_ampersand) and (self.lv & self.char_is_semicolon):
-            s = self.ncs_group(s, ht, 'repair-xml', self.repair_xml, loc_id)
-        if self.lv & self.char_is_percent_sign:
-            s = self.ncs_group(s, ht, 'repair-url-espaces', self.repair_url_escapes, loc_id)
-        if ((self.lv & self.char_is_arabic)
-                and ((self.lv & self.char_is_detachable_from_token)
-                     or (self.lv & self.char_is_mappable_decimal_digit))):
-            s = self.ncs_group(s, ht, 'repair-token', self.repair_arabic_tokenization, loc_id)
+        lv = self.norm_step_lv(s)
+        for group_name, group_function in self.applicable_norm_steps(lv, lang_code, skip_steps):
+            s = self.ncs_group(s, ht, group_name, group_function, loc_id)
         if s != orig_s:
             self.increment_dict_count(ht, 'COUNT-ALL')
         # remove trailing spaces (before tab or end of line)
-        s = re.sub(' +(?=[\t\n])', '', s)
+        if ' \t' in s or ' \n' in s:
+            s = trailing_spaces_re.sub('', s)
         return s
 
-    def norm_clean_lines(self, ht: dict, input_file: TextIO, output_file: TextIO, lang_code=''):
-        """Apply normalization/cleaning to a file (or STDIN/STDOUT)."""
-        line_number = 0
-        for line in input_file:
-            line_number += 1
-            output_file.write(self.norm_clean_string(line.rstrip(" \n"), ht, lang_code=lang_code,
-                                                     loc_id=str(line_number))
-                              + "\n")
+    def norm_clean_line(self, s: str, ht: dict, lang_code: str, line_number: int, skip_steps: frozenset,
+                        line_cache: dict) -> str:
+        """
+        Like norm_clean_string, but reuses the result of an identical earlier line recorded in line_cache,
+        updating the change stats in ht as if the line had been normalized again.
+        A line is cached when it occurs for the second time, so unique lines cost just one extra dict lookup.
+        A line_cache may only be shared by lines with the same lang_code, skip_steps and SKIP- entries in ht,
+        as within norm_clean_lines.
+        """
+        cached = line_cache.get(s, False)
+        if not cached:
+            if cached is False:  # first occurrence
+                # Cache result, but avoid clogging run-time memory space
+                if len(line_cache) < 100000:
+                    line_cache[s] = None
+                return self.norm_clean_string(s, ht, lang_code=lang_code, loc_id=line_number, skip_steps=skip_steps)
+            # Normalize with the same steps skipped as in ht, but keep only the line's change stats.
+            skip_keys = [key for key in ht if key.startswith('SKIP-')]
+            line_ht = {key: ht[key] for key in skip_keys}
+            result = self.norm_clean_string(s, line_ht, lang_code=lang_code, skip_steps=skip_steps)
+            for key in skip_keys:
+                del line_ht[key]
+            del line_ht['NUMBER-OF-LINES']
+            cached = (result, line_ht)
+            # Look-alike correction also collects token stats, so such lines are always normalized afresh.
+            if 'CALL-look-alike' not in line_ht:
+                line_cache[s] = cached
+        ht['NUMBER-OF-LINES'] = ht.get('NUMBER-OF-LINES', 0) + 1
+        for key, increment in cached[1].items():
+            count = ht.get(key, 0) + increment
+            ht[key] = count
+            # Record change location as ncs_group does.
+            if count <= 20 and key.startswith('COUNT-') and key != 'COUNT-ALL':
+                ht[f'{key}-{count}'] = str(line_number)
+        return cached[0]
+
+    def norm_clean_line_batch(self, lines: List[str], ht: dict, lang_code='', first_line_number: int = 1,
+                              skip_steps: frozenset = frozenset(), line_cache: Optional[dict] = None) -> str:
+        """Apply normalization/cleaning to a batch of lines (without linefeeds), numbered from first_line_number.
+        Returns the normalized lines as a single string, each line terminated by a linefeed.
+        An optional line_cache (see norm_clean_line) reuses the results of repeated lines."""
+        if not lines:
+            return ''
+        batch = "\n".join(lines) + "\n"
+        # A line's character type vector is a subset of the batch's, so if no normalization step applies to the
+        # batch as a whole, none applies to any of its lines, leaving only the removal of trailing spaces.
+        if not self.applicable_norm_steps(self.norm_step_lv(batch), lang_code, skip_steps):
+            ht['NUMBER-OF-LINES'] = ht.get('NUMBER-OF-LINES', 0) + len(lines)
+            return trailing_spaces_re.sub('', batch) if (' \t' in batch or ' \n' in batch) else batch
+        # Linefeeds are added by the join (plus one at the end), rather than appended to each line.
+        if line_cache is not None:
+            return "\n".join([self.norm_clean_line(line.rstrip(" "), ht, lang_code, line_number, skip_steps,
+                                                   line_cache)
+                              for line_number, line in enumerate(lines, first_line_number)]) + "\n"
+        return "\n".join([self.norm_clean_string(line.rstrip(" "), ht, lang_code=lang_code,
+                                                 loc_id=line_number, skip_steps=skip_steps)
+                          for line_number, line in enumerate(lines, first_line_number)]) + "\n"
+
+    def norm_clean_lines(self, ht: dict, input_file: TextIO, output_file: TextIO, lang_code='',
+                         output_batch_size: int = 1024, jobs: int = 1):
+        """Apply normalization/cleaning to a file (or STDIN/STDOUT).
+        Output lines are collected and written in batches of output_batch_size lines to reduce write calls.
+        With jobs > 1, batches are normalized in parallel by a pool of worker processes."""
+        # lang_code is fixed for the entire file, so resolve its language-specific step variant once.
+        lang_code = self.norm_step_lang_variant(lang_code)
+        line_batches = batch_lines(read_lines_in_chunks(input_file), output_batch_size)
+        if jobs > 1:
+            skip_ht = {key: value for key, value in ht.items() if key.startswith('SKIP-')}
+            with multiprocessing.Pool(jobs, initializer=init_norm_clean_worker,
+                                      initargs=(skip_ht, lang_code, bool(self.look_alike_dict))) as pool:
+                # imap preserves the order of the batches, so output lines stay in input order.
+                for output, batch_ht, look_alike_stats in pool.imap(norm_clean_line_batch_in_worker, line_batches):
+                    output_file.write(output)
+                    self.merge_norm_clean_stats(ht, batch_ht)
+                    self.merge_look_alike_stats(look_alike_stats)
+            return
+        # The steps to be skipped are fixed for the entire file, so leave them out of the dispatch table up front.
+        skip_steps = self.skip_steps_in_ht(ht)
+        # Repeated lines (frequent in large corpora) are normalized only once.
+        line_cache = {}
+        prefetched_line_batches = prefetch(line_batches)
+        try:
+            for first_line_number, lines in prefetched_line_batches:
+                output_file.write(self.norm_clean_line_batch(lines, ht, lang_code=lang_code,
+                                                             first_line_number=first_line_number,
+                                                             skip_steps=skip_steps, line_cache=line_cache))
+        finally:
+            # Stop reading ahead if writing or normalization fails.
+            prefetched_line_batches.close()
+
+    @staticmethod
+    def merge_norm_clean_stats(ht: dict, batch_ht: dict) -> None:
+        """Adds the change stats of a batch (as collected by a worker process) to ht.
+        Change locations (COUNT-<group>-<n>) are renumbered to follow those already recorded in ht."""
+        prev_counts = {key: ht.get(key, 0) for key in batch_ht if key.startswith('COUNT-')}
+        for key, value in batch_ht.items():
+            if key.startswith('SKIP-'):
+                continue
+            if isinstance(value, str):
+                group_key, _, index = key.rpartition('-')
+                global_index = prev_counts.get(group_key, 0) + int(index)
+                if global_index <= 20:
+                    ht[f'{group_key}-{global_index}'] = value
+            else:
+                ht[key] = ht.get(key, 0) + value
+
+    def pop_look_alike_stats(self) -> tuple:
+        """Returns and resets the look-alike counts and token stats collected so far (see correct_look_alikes)."""
+        n_counts = {key: self.look_alike_dict.pop(key) for key in list(self.look_alike_dict) if key.startswith('n-')}
+        stats = (n_counts, self.look_alike_unchanged_dict, self.look_alike_split_dict, self.look_alike_url_dict)
+        self.look_alike_unchanged_dict, self.look_alike_split_dict, self.look_alike_url_dict = {}, {}, {}
+        return stats
+
+    def merge_look_alike_stats(self, stats: tuple) -> None:
+        """Adds look-alike stats returned by pop_look_alike_stats (e.g. in a worker process)."""
+        n_counts, unchanged_dict, split_dict, url_dict = stats
+        for key, count in n_counts.items():
+            self.look_alike_dict[key] = self.look_alike_dict.get(key, 0) + count
+        for token, count in unchanged_dict.items():
+            self.look_alike_unchanged_dict[token] = self.look_alike_unchanged_dict.get(token, 0) + count
+        for orig_token, token in split_dict.items():
+            self.look_alike_split_dict.setdefault(orig_token, token)
+        for orig_token in url_dict:
+            self.look_alike_url_dict.setdefault(orig_token, True)
 
     def build_norm_step_dict(self, base: str = 'DEFAULT',
                              skip: Optional[List[str]] = None,
@@ -1477,7 +1791,7 @@ class Wildebeest:
             base_elems = self.all_norm_elems
         else:  # base == 'DEFAULT'
             base_elems = self.default_norm_elems
-        norm_step_dict = {}
+        norm_step_dict = defaultdict(int)
         for norm_elem in self.all_norm_elems:
             norm_step_dict[f'SKIP-{norm_elem}'] = (norm_elem not in base_elems)
         if skip:
@@ -1489,17 +1803,106 @@ class Wildebeest:
         return norm_step_dict
 
 
+def read_lines_in_chunks(input_file: TextIO, chunk_size: int = 1 << 20) -> Iterator[str]:
+    """Reads input_file in chunks of chunk_size characters and yields its lines (without final linefeed).
+    Splits on linefeed only (like line-by-line iteration over a text file), as other line boundaries recognized by
+    str.splitlines (e.g. form feed, U+2028 line separator) are characters that normalization steps handle."""
+    partial_line = ''
+    while chunk := input_file.read(chunk_size):
+        lines = chunk.split('\n')
+        lines[0] = partial_line + lines[0]
+        partial_line = lines.pop()
+        yield from lines
+    if partial_line:
+        yield partial_line
+
+
+def batch_lines(lines: Iterator[str], batch_size: int) -> Iterator[Tuple[int, List[str]]]:
+    """Groups lines into lists of (up to) batch_size lines; yields pairs of first line number and list of lines."""
+    first_line_number = 1
+    while batch := list(islice(lines, batch_size)):
+        yield first_line_number, batch
+        first_line_number += len(batch)
+
+
+def prefetch(items: Iterator, maxsize: int = 4) -> Iterator:
+    """Produces items in a background thread, holding up to maxsize items ahead of the consumer,
+    so that reading input (e.g. from a slow pipe) overlaps with normalization in the consuming thread.
+    Errors in producing items are raised in the consumer. If the consumer stops early (closing the generator),
+    the background thread stops as well."""
+    item_queue = queue.Queue(maxsize)
+    end_of_items = object()
+    stop = threading.Event()
+
+    def put(entry: tuple) -> bool:
+        # Wait for space in the queue, but give up once the consumer has stopped.
+        while not stop.is_set():
+            try:
+                item_queue.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for item in items:
+                if not put((item, None)):
+                    return
+            put((end_of_items, None))
+        except BaseException as e:
+            put((end_of_items, e))
+
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            item, error = item_queue.get()
+            if item is end_of_items:
+                if error:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+
+
+# Per-process state of the worker processes of a parallel norm_clean_lines (see init_norm_clean_worker).
+norm_clean_worker = {}
+
+
+def init_norm_clean_worker(skip_ht: dict, lang_code: str, load_look_alikes: bool) -> None:
+    wb = Wildebeest()
+    if load_look_alikes:
+        wb.load_look_alike_file()
+    norm_clean_worker.update(wb=wb, skip_ht=skip_ht, lang_code=lang_code,
+                             skip_steps=Wildebeest.skip_steps_in_ht(skip_ht), line_cache={})
+
+
+def norm_clean_line_batch_in_worker(line_batch: Tuple[int, List[str]]) -> Tuple[str, dict, tuple]:
+    """Normalizes a batch of lines in a worker process; returns output along with the batch's change stats."""
+    first_line_number, lines = line_batch
+    wb = norm_clean_worker['wb']
+    ht = defaultdict(int, norm_clean_worker['skip_ht'])
+    output = wb.norm_clean_line_batch(lines, ht, lang_code=norm_clean_worker['lang_code'],
+                                      first_line_number=first_line_number,
+                                      skip_steps=norm_clean_worker['skip_steps'],
+                                      line_cache=norm_clean_worker['line_cache'])
+    return output, dict(ht), wb.pop_look_alike_stats()
+
+
 def listify_by_comma(s: str) -> list:
     """Converts string with comma-separated elements to list, e.g. 'a,b, c' -> ['a', 'b', 'c']; '' -> []"""
-    return [] if re.match(r'\s*$', s) else re.split(r',\s*', s.strip())
+    s = s.strip()
+    return [elem.strip() for elem in s.split(',')] if s else []
 
 
 # noinspection SpellCheckingInspection
 def main():
     """Wrapper around normalization/cleaning that takes care of argument parsing and prints change stats to STDERR."""
     wb = Wildebeest()
+    default_norm_elem_set = set(wb.default_norm_elems)
     # additional_norm_elems = all_norm_elems - default_norm_elems
-    additional_norm_elems = [elem for elem in wb.all_norm_elems if elem not in wb.default_norm_elems]
+    additional_norm_elems = [elem for elem in wb.all_norm_elems if elem not in default_norm_elem_set]
     # parse arguments
     skip_help = f"perform all default normalization/cleaning steps except those specified in comma-separated list \
     (default normalization/cleaning steps: {','.join(wb.default_norm_elems)})"
@@ -1507,9 +1910,12 @@ def main():
     (non-default normalization/cleaning steps: {','.join(additional_norm_elems)})"
     parser = argparse.ArgumentParser(description='Normalizes and cleans a given text, largely at the character level',
                                      prog="wb-norm")
-    parser.add_argument('-i', '--input', type=argparse.FileType('r', encoding='utf-8', errors='surrogateescape'),
+    # Large (1 MB) file buffers reduce the number of read/write system calls on big files.
+    parser.add_argument('-i', '--input', type=argparse.FileType('r', bufsize=1 << 20, encoding='utf-8',
+                                                                errors='surrogateescape'),
                         default=sys.stdin, metavar='INPUT-FILENAME', help='(default: STDIN)')
-    parser.add_argument('-o', '--output', type=argparse.FileType('w', encoding='utf-8', errors='ignore'),
+    parser.add_argument('-o', '--output', type=argparse.FileType('w', bufsize=1 << 20, encoding='utf-8',
+                                                                 errors='ignore'),
                         default=sys.stdout, metavar='OUTPUT-FILENAME', help='(default: STDOUT)')
     parser.add_argument('--lc', type=str, default='', metavar='LANGUAGE-CODE', help="ISO 639-3, e.g. 'fas' for Persian")
     parser.add_argument('--skip', type=str, default='', metavar='NORM-STEPS', help=skip_help)
@@ -1520,6 +1926,8 @@ def main():
                         help='perform all normalization/cleaning steps except those specified in comma-separated list')
     parser.add_argument('--only', type=str, default='', metavar='NORM-STEPS',
                         help='perform only normalization/cleaning steps specified in comma-separated list')
+    parser.add_argument('-j', '--jobs', type=int, default=1, metavar='N',
+                        help='number of parallel worker processes (default: 1)')
     parser.add_argument('-v', '--verbose', action='count', default=0, help='write change log etc. to STDERR')
     parser.add_argument('--version', action='version',
                         version=f'%(prog)s {__version__} last modified: {last_mod_date}')
@@ -1527,6 +1935,7 @@ def main():
     lang_code = args.lc
     add_list = listify_by_comma(args.add) + listify_by_comma(args.only)
     skip_list = listify_by_comma(args.skip) + listify_by_comma(args.all_except)
+    add_set, skip_set = set(add_list), set(skip_list)
 
     # Open any input or output files. Make sure utf-8 encoding is properly set (in older Python3 versions).
     if args.input is sys.stdin and not re.search('utf-8', sys.stdin.encoding, re.IGNORECASE):
@@ -1536,7 +1945,7 @@ def main():
         log.error(f"Error: Bad STDIN/STDOUT encoding '{sys.stdout.encoding}' as opposed to 'utf-8'. \
                     Suggestion: 'export PYTHONIOENCODING=UTF-8' or use use '--output FILENAME' option")
 
-    ht = {}
+    ht = defaultdict(int)
     norm_elems, skip_elems = [], []
     if args.all and args.all_except:
         log.warning("Will ignore option --all due to presence of option --all-except")
@@ -1545,7 +1954,7 @@ def main():
             log.warning("Will re-interpret option --only as option --add due to presence of option --all-except")
         elif args.all:
             log.warning("Will ignore option --only due to presence of optioen --all")
-    if add_and_skip := [elem for elem in add_list if elem in skip_list]:
+    if add_and_skip := [elem for elem in add_list if elem in skip_set]:
         if len(add_and_skip) == 1:
             plural_s, be_verb = "", "is"
         else:
@@ -1553,15 +1962,15 @@ def main():
         log.warning(f"The following normalization step{plural_s} {be_verb} specified as both to be performed "
                     f"and not to be performed: {', '.join(add_and_skip)} (will perform the step{plural_s}).")
     for norm_elem in wb.all_norm_elems:
-        if norm_elem in add_list:
+        if norm_elem in add_set:
             skip = False
-        elif norm_elem in skip_list:
+        elif norm_elem in skip_set:
             skip = True
         elif args.all or args.all_except:
             skip = False
         elif args.only:
             skip = True
-        elif norm_elem in wb.default_norm_elems:
+        elif norm_elem in default_norm_elem_set:
             skip = False
         else:
             skip = True
@@ -1576,8 +1985,8 @@ def main():
     # Add a little language code robustness for Persian language code, more comprehensive solution to come
     if lang_code == 'fa':
         lang_code = 'fas'
-    start_time = datetime.datetime.now()
     if args.verbose:
+        start_time = datetime.datetime.now()  # only reported in verbose mode
         log.info(f'Start: {start_time}')
         log.info('Script wb_normalize.py')
         if args.input is not sys.stdin:
@@ -1590,33 +1999,28 @@ def main():
             log.info(f'ISO 639-3 language code: {lang_code}')
     wb.load_look_alike_file()
     # The following line is the core call. ht is a dictionary (empty if no steps are to be skipped).
-    wb.norm_clean_lines(ht, input_file=args.input, output_file=args.output, lang_code=lang_code)
+    wb.norm_clean_lines(ht, input_file=args.input, output_file=args.output, lang_code=lang_code,
+                        jobs=args.jobs)
     # Log some change stats.
     if args.verbose:
-        n_unchanged = 0
-        for unchanged_token in sorted(wb.look_alike_unchanged_dict.keys(),
-                                      key=lambda s: wb.look_alike_unchanged_dict[s],
-                                      reverse=True):
-            n_unchanged += 1
-            if n_unchanged <= 100:
-                count = wb.look_alike_unchanged_dict[unchanged_token]
-                log.debug(f'   unchanged mixed token: {unchanged_token} ({count})')
-        change_count = ht.get('COUNT-ALL', 0)
-        number_of_lines = ht.get('NUMBER-OF-LINES', 0)
+        for unchanged_token, count in heapq.nlargest(100, wb.look_alike_unchanged_dict.items(), key=itemgetter(1)):
+            log.debug(f'   unchanged mixed token: {unchanged_token} ({count})')
+        change_count = ht['COUNT-ALL']
+        number_of_lines = ht['NUMBER-OF-LINES']
         lines = 'line' if change_count == 1 else 'lines'
-        log_info = f"{str(change_count)} out of {str(number_of_lines)} {lines} changed"
+        log_info_parts = [f"{change_count} out of {number_of_lines} {lines} changed"]
         for skip_elem in wb.all_norm_elems:
-            n_changed_lines = ht.get(f'COUNT-{skip_elem}', 0)
-            n_lines_with_call = ht.get(f'CALL-{skip_elem}', 0)
+            n_changed_lines = ht[f'COUNT-{skip_elem}']
             if n_changed_lines:
+                n_lines_with_call = ht[f'CALL-{skip_elem}']
                 lines = 'line' if n_changed_lines == 1 else 'lines'
-                log_info += f'; {skip_elem} in {str(n_changed_lines)}/{str(n_lines_with_call)} {lines}'
+                log_info_part = f'{skip_elem} in {n_changed_lines}/{n_lines_with_call} {lines}'
                 if skip_elem == 'look-alike':
-                    n_change_list = []
-                    for key in ['n-to-Latin', 'n-to-Cyrillic', 'n-to-Greek', 'n-split', 'n-unchanged']:
-                        n_change_list.append(str(wb.look_alike_dict.get(key, 0)))
-                    log_info += f" ({'/'.join(n_change_list)} L/C/G/S/-)"
-        log.info(log_info)
+                    n_change_list = [str(wb.look_alike_dict.get(key, 0))
+                                     for key in ['n-to-Latin', 'n-to-Cyrillic', 'n-to-Greek', 'n-split', 'n-unchanged']]
+                    log_info_part += f" ({'/'.join(n_change_list)} L/C/G/S/-)"
+                log_info_parts.append(log_info_part)
+        log.info('; '.join(log_info_parts))
         end_time = datetime.datetime.now()
         log.info(f'End: {end_time}')
         elapsed_time = end_time - start_time